@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 from typing import TYPE_CHECKING, Sequence
 
 from cryptography.hazmat.primitives import serialization
@@ -11,6 +12,9 @@ from ..models.message import Message
 if TYPE_CHECKING:
     from .... import Node
 
+# handshake content starts with the sender's big-endian incoming port
+_PORT = struct.Struct(">H")
+
 
 def handle_handshake(node: "Node", addr: Sequence[object], message: Message) -> bool:
     """Handle incoming handshake messages.
@@ -26,7 +30,7 @@ def handle_handshake(node: "Node", addr: Sequence[object], message: Message) ->
 
     try:
         host = addr[0]
-        port = int.from_bytes(message.content[:2], "big", signed=False)
+        (port,) = _PORT.unpack_from(message.content)
     except Exception:
         return True
     peer_address = (host, port)
@@ -52,12 +56,7 @@ def handle_handshake(node: "Node", addr: Sequence[object], message: Message) ->
             peer_address[0],
             peer_address[1],
         )
-        response = Message(
-            handshake=True,
-            sender=node.relay_public_key,
-            content=int(node.config["incoming_port"]).to_bytes(2, "big", signed=False),
-        )
-        node.outgoing_queue.put((response.to_bytes(), peer_address))
+        node.outgoing_queue.put((node.handshake_bytes, peer_address))
         return True
 
     if old_key_bytes == sender_public_key_bytes:
@@ -1,9 +1,8 @@
 import logging
-import socket
 from enum import IntEnum
 from typing import TYPE_CHECKING, Tuple
 
-from .object_response import ObjectResponse, ObjectResponseType
+from .object_response import ObjectResponse, ObjectResponseType, encode_object_provider
 from ..models.message import Message, MessageTopic
 from ..util import xor_distance
 
@@ -18,6 +17,8 @@ class ObjectRequestType(IntEnum):
 
 
 class ObjectRequest:
+    __slots__ = ("type", "data", "atom_id")
+
     type: ObjectRequestType
     data: bytes
     atom_id: bytes
@@ -42,7 +43,7 @@ class ObjectRequest:
         except ValueError:
             raise ValueError(f"Unknown ObjectRequestType: {type_val!r}")
 
-        atom_id_bytes = data[1:33]
+        atom_id_bytes = bytes(data[1:33])
         payload    = data[33:]
         return cls(req_type, payload, atom_id_bytes)
 
@@ -50,15 +51,12 @@ class ObjectRequest:
 def encode_peer_contact_bytes(peer: "Peer") -> bytes:
     """Return a fixed-width peer contact payload (32-byte key + IPv4 + port)."""
     host, port = peer.address
-    key_bytes = peer.public_key_bytes
+    if not (0 <= port <= 0xFFFF):
+        raise ValueError(f"port out of range (0-65535): {port}")
     try:
-        ip_bytes = socket.inet_aton(host)
+        return encode_object_provider(peer.public_key_bytes, host, port)
     except OSError as exc:  # pragma: no cover - inet_aton raises for invalid hosts
         raise ValueError(f"invalid IPv4 address: {host}") from exc
-    if not (0 <= port <= 0xFFFF):
-        raise ValueError(f"port out of range (0-65535): {port}")
-    port_bytes = int(port).to_bytes(2, "big", signed=False)
-    return key_bytes + ip_bytes + port_bytes
 
 
 def handle_object_request(node: "Node", peer: "Peer", message: Message) -> None:
@@ -88,7 +86,7 @@ def handle_object_request(node: "Node", peer: "Peer", message: Message) -> None:
                 obj_res_msg  = Message(
                     topic=MessageTopic.OBJECT_RESPONSE,
                     body=resp.to_bytes(),
-                    sender=node.relay_public_key,
+                    sender_bytes=node.relay_public_key_bytes,
                 )
                 obj_res_msg.encrypt(peer.shared_key_bytes)
                 node.outgoing_queue.put((obj_res_msg.to_bytes(), peer.address))
@@ -105,7 +103,7 @@ def handle_object_request(node: "Node", peer: "Peer", message: Message) -> None:
                 obj_res_msg = Message(
                     topic=MessageTopic.OBJECT_RESPONSE,
                     body=resp.to_bytes(),
-                    sender=node.relay_public_key,
+                    sender_bytes=node.relay_public_key_bytes,
                 )
                 obj_res_msg.encrypt(peer.shared_key_bytes)
                 node.outgoing_queue.put((obj_res_msg.to_bytes(), peer.address))
@@ -124,7 +122,7 @@ def handle_object_request(node: "Node", peer: "Peer", message: Message) -> None:
                 obj_res_msg = Message(
                     topic=MessageTopic.OBJECT_RESPONSE,
                     body=resp.to_bytes(),
-                    sender=node.relay_public_key,
+                    sender_bytes=node.relay_public_key_bytes,
                 )
                 obj_res_msg.encrypt(nearest_peer.shared_key_bytes)
                 node.outgoing_queue.put((obj_res_msg.to_bytes(), peer.address))
@@ -152,7 +150,7 @@ def handle_object_request(node: "Node", peer: "Peer", message: Message) -> None:
 
             if is_self_closest:
                 node.logger.debug("Storing provider info for %s locally", object_request.atom_id.hex())
-                node.storage_index[object_request.atom_id] = object_request.data
+                node.storage_index[object_request.atom_id] = bytes(object_request.data)
             else:
                 node.logger.debug(
                     "Forwarding OBJECT_PUT for %s to nearer peer %s",
@@ -167,7 +165,7 @@ def handle_object_request(node: "Node", peer: "Peer", message: Message) -> None:
                 obj_req_msg = Message(
                     topic=MessageTopic.OBJECT_REQUEST,
                     body=fwd_req.to_bytes(),
-                    sender=node.relay_public_key,
+                    sender_bytes=node.relay_public_key_bytes,
                 )
                 obj_req_msg.encrypt(nearest_peer.shared_key_bytes)
                 node.outgoing_queue.put((obj_req_msg.to_bytes(), nearest_peer.address))
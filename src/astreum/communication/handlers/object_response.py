@@ -1,4 +1,5 @@
 import socket
+import struct
 from enum import IntEnum
 from typing import Tuple, TYPE_CHECKING
 
@@ -10,6 +11,10 @@ if TYPE_CHECKING:
     from ..models.peer import Peer
 
 
+# provider public key + IPv4 address + port
+_OBJECT_PROVIDER = struct.Struct(">32s4sH")
+
+
 class ObjectResponseType(IntEnum):
     OBJECT_FOUND = 0
     OBJECT_PROVIDER = 1
@@ -17,6 +22,8 @@ class ObjectResponseType(IntEnum):
 
 
 class ObjectResponse:
+    __slots__ = ("type", "data", "atom_id")
+
     type: ObjectResponseType
     data: bytes
     atom_id: bytes
@@ -27,7 +34,7 @@ class ObjectResponse:
         self.atom_id = atom_id
 
     def to_bytes(self):
-        return bytes([self.type.value]) + self.atom_id + self.data
+        return b"".join((bytes((self.type.value,)), self.atom_id, self.data))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "ObjectResponse":
@@ -41,22 +48,23 @@ class ObjectResponse:
         except ValueError:
             raise ValueError(f"Unknown ObjectResponseType: {type_val}")
 
-        atom_id = data[1:33]
-        payload   = data[33:]
+        atom_id = bytes(data[1:33])
+        # a view, not a copy: the payload is copied once, into the Atom it becomes
+        payload   = memoryview(data)[33:]
         return cls(resp_type, payload, atom_id)
 
 
+def encode_object_provider(public_key: bytes, address: str, port: int) -> bytes:
+    """Pack a provider contact; raises OSError/struct.error for a bad address or port."""
+    return _OBJECT_PROVIDER.pack(public_key, socket.inet_aton(address), port)
+
+
 def decode_object_provider(payload: bytes) -> Tuple[bytes, str, int]:
-    expected_len = 32 + 4 + 2
-    if len(payload) < expected_len:
+    if len(payload) < _OBJECT_PROVIDER.size:
         raise ValueError("provider payload too short")
 
-    provider_public_key = payload[:32]
-    provider_ip_bytes = payload[32:36]
-    provider_port_bytes = payload[36:38]
-
+    provider_public_key, provider_ip_bytes, provider_port = _OBJECT_PROVIDER.unpack_from(payload)
     provider_address = socket.inet_ntoa(provider_ip_bytes)
-    provider_port = int.from_bytes(provider_port_bytes, byteorder="big", signed=False)
     return provider_public_key, provider_address, provider_port
 
 
@@ -76,6 +84,11 @@ def handle_object_response(node: "Node", peer: "Peer", message: Message) -> None
 
     match object_response.type:
         case ObjectResponseType.OBJECT_FOUND:
+            # duplicates of unrequested atoms were dropped above; an atom that
+            # reached hot storage another way since we asked needs no hashing
+            if object_response.atom_id in node.hot_storage:
+                node.pop_atom_req(object_response.atom_id)
+                return
             atom = Atom.from_bytes(object_response.data)
             atom_id = atom.object_id()
             if object_response.atom_id == atom_id:
@@ -106,7 +119,7 @@ def handle_object_response(node: "Node", peer: "Peer", message: Message) -> None
             obj_req_msg = Message(
                 topic=MessageTopic.OBJECT_REQUEST,
                 body=obj_req_bytes,
-                sender=node.relay_public_key,
+                sender_bytes=node.relay_public_key_bytes,
             )
             obj_req_msg.encrypt(peer.shared_key_bytes)
             node.outgoing_queue.put((obj_req_msg.to_bytes(), (provider_address, provider_port)))
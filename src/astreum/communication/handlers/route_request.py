@@ -1,14 +1,41 @@
 from __future__ import annotations
 
 import socket
+import time
 
 from ..models.message import Message, MessageTopic
-from ..util import xor_distance
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .... import Node
     from ..models.peer import Peer
+    from ..models.route import Route
+
+ROUTE_CACHE_LIMIT = 1024
+
+
+def _route_payload(node: "Node", route: "Route", sender_public_key: bytes) -> bytes:
+    """Encode the closest reachable peer to ``sender_public_key`` from each bucket."""
+    # one growing buffer instead of a bytes object per entry plus a final join
+    payload = bytearray()
+    for closest_key in route.closest_per_bucket(sender_public_key):
+        bucket_peer = node.get_peer(closest_key)
+        if bucket_peer is None or bucket_peer.address is None:
+            continue
+
+        host, port = bucket_peer.address
+        try:
+            address_bytes = socket.inet_pton(socket.AF_INET, host)
+        except OSError:
+            try:
+                address_bytes = socket.inet_pton(socket.AF_INET6, host)
+            except OSError as exc:
+                node.logger.warning("Invalid peer address %s: %s", bucket_peer.address, exc)
+                continue
+
+        payload += address_bytes
+        payload += int(port).to_bytes(2, "big", signed=False)
+    return bytes(payload)
 
 
 def handle_route_request(node: "Node", peer: "Peer", message: Message) -> None:
@@ -32,45 +59,28 @@ def handle_route_request(node: "Node", peer: "Peer", message: Message) -> None:
         node.logger.warning("Unknown route id %s in ROUTE_REQUEST from %s", route_id, peer.address)
         return
 
-    payload_parts = []
-    for bucket in route.buckets.values():
-        closest_key = None
-        closest_distance = None
-
-        for peer_key in bucket:
-            try:
-                distance = xor_distance(sender_public_key, peer_key)
-            except ValueError:
-                continue
-
-            if closest_distance is None or distance < closest_distance:
-                closest_distance = distance
-                closest_key = peer_key
-
-        if closest_key is None:
-            continue
-
-        bucket_peer = node.get_peer(closest_key)
-        if bucket_peer is None or bucket_peer.address is None:
-            continue
-
-        host, port = bucket_peer.address
-        try:
-            address_bytes = socket.inet_pton(socket.AF_INET, host)
-        except OSError:
-            try:
-                address_bytes = socket.inet_pton(socket.AF_INET6, host)
-            except OSError as exc:
-                node.logger.warning("Invalid peer address %s: %s", bucket_peer.address, exc)
-                continue
-
-        port_bytes = int(port).to_bytes(2, "big", signed=False)
-        payload_parts.append(address_bytes + port_bytes)
+    # the answer only changes when the route does (or a peer moves, which the
+    # TTL bounds), so repeated requests from one sender reuse the encoding
+    cache = node.route_response_cache
+    cache_key = (route_id, sender_public_key)
+    now = time.monotonic()
+    cached = cache.get(cache_key)
+    if (
+        cached is not None
+        and cached[1] == route.version
+        and now - cached[0] < node.route_cache_ttl
+    ):
+        payload = cached[2]
+    else:
+        payload = _route_payload(node, route, sender_public_key)
+        if len(cache) >= ROUTE_CACHE_LIMIT:
+            cache.clear()
+        cache[cache_key] = (now, route.version, payload)
 
     response = Message(
         topic=MessageTopic.ROUTE_RESPONSE,
-        content=b"".join(payload_parts),
-        sender=node.relay_public_key,
+        content=payload,
+        sender_bytes=node.relay_public_key_bytes,
     )
     response.encrypt(peer.shared_key_bytes)
     node.outgoing_queue.put((response.to_bytes(), peer.address))
@@ -0,0 +1,282 @@
+"""Batched UDP I/O via Linux recvmmsg(2)/sendmmsg(2), falling back to recvfrom/sendto elsewhere."""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import os
+import socket
+import sys
+from typing import Dict, List, Optional, Tuple
+
+Address = Tuple  # (host, port) or (host, port, flowinfo, scope_id) as socket returns
+
+MSG_WAITFORONE = 0x10000
+_SOCKADDR_STORAGE_SIZE = 128
+_ADDRESS_CACHE_LIMIT = 1024
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_libc_function(name: str):
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        func = getattr(ctypes.CDLL(None, use_errno=True), name)
+    except (OSError, AttributeError):
+        return None
+    func.restype = ctypes.c_int
+    return func
+
+
+_recvmmsg = _load_libc_function("recvmmsg")
+if _recvmmsg is not None:
+    _recvmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+
+
+def _decode_address(raw: bytes) -> Address:
+    """Decode a sockaddr_in/sockaddr_in6 into the tuple socket.recvfrom returns."""
+    family = int.from_bytes(raw[0:2], sys.byteorder)
+    port = int.from_bytes(raw[2:4], "big")
+    if family == socket.AF_INET:
+        return socket.inet_ntop(socket.AF_INET, raw[4:8]), port
+    if family == socket.AF_INET6:
+        return (
+            socket.inet_ntop(socket.AF_INET6, raw[8:24]),
+            port,
+            int.from_bytes(raw[4:8], "big"),
+            int.from_bytes(raw[24:28], sys.byteorder),
+        )
+    raise OSError(f"unsupported address family {family}")
+
+
+class BatchReceiver:
+    """Receive up to ``max_messages`` datagrams per syscall from a blocking UDP socket.
+
+    Buffers are allocated once and reused. ``recv`` blocks until at least one
+    datagram is ready (MSG_WAITFORONE) and then returns whatever else is already
+    queued. Datagrams longer than ``bufsize`` are truncated, as with recvfrom.
+
+    ctypes drops the GIL for the duration of the recvmmsg call, so the
+    processing thread keeps running while this one waits on the kernel; the
+    Python work left per batch is copying payloads out and looking up the
+    sender address, which is memoised per raw sockaddr.
+    """
+
+    def __init__(self, sock: socket.socket, max_messages: int = 64, bufsize: int = 4096):
+        self.sock = sock
+        self.max_messages = max_messages
+        self.bufsize = bufsize
+        self._msgvec: Optional[ctypes.Array] = None
+        self._addresses: Dict[bytes, Address] = {}
+        # a socket timeout makes the fd non-blocking, which recvmmsg would
+        # turn into a busy loop; keep recvfrom semantics for those sockets
+        if _recvmmsg is None or sock.gettimeout() is not None:
+            return
+
+        self._buffers = [ctypes.create_string_buffer(bufsize) for _ in range(max_messages)]
+        self._names = [
+            ctypes.create_string_buffer(_SOCKADDR_STORAGE_SIZE) for _ in range(max_messages)
+        ]
+        self._iovecs = (_IOVec * max_messages)()
+        self._msgvec = (_MMsgHdr * max_messages)()
+        for idx in range(max_messages):
+            self._iovecs[idx].iov_base = ctypes.addressof(self._buffers[idx])
+            self._iovecs[idx].iov_len = bufsize
+            hdr = self._msgvec[idx].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._names[idx])
+            hdr.msg_iov = ctypes.pointer(self._iovecs[idx])
+            hdr.msg_iovlen = 1
+
+    def recv(self) -> List[Tuple[bytes, Address]]:
+        if self._msgvec is None:
+            return [self.sock.recvfrom(self.bufsize)]
+
+        msgvec = self._msgvec
+        for idx in range(self.max_messages):
+            msgvec[idx].msg_hdr.msg_namelen = _SOCKADDR_STORAGE_SIZE
+
+        count = _recvmmsg(self.sock.fileno(), msgvec, self.max_messages, MSG_WAITFORONE, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err == errno.EINTR:
+                return []
+            raise OSError(err, os.strerror(err))
+
+        addresses = self._addresses
+        received: List[Tuple[bytes, Address]] = []
+        for idx in range(count):
+            msg = msgvec[idx]
+            data = ctypes.string_at(self._buffers[idx], min(msg.msg_len, self.bufsize))
+            name = ctypes.string_at(self._names[idx], msg.msg_hdr.msg_namelen)
+            addr = addresses.get(name)
+            if addr is None:
+                addr = _decode_address(name)
+                if len(addresses) >= _ADDRESS_CACHE_LIMIT:
+                    addresses.clear()
+                addresses[name] = addr
+            received.append((data, addr))
+        return received
+
+
+_sendmmsg = _load_libc_function("sendmmsg")
+if _sendmmsg is not None:
+    _sendmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+
+
+def _encode_address(family: int, addr: Address) -> Optional[bytes]:
+    """Encode a numeric (host, port[, flowinfo, scope_id]) tuple as a sockaddr.
+
+    Returns None when the host is not a literal address of ``family`` (e.g. a
+    hostname), leaving resolution to sendto.
+    """
+    host, port = addr[0], addr[1]
+    try:
+        packed = socket.inet_pton(family, host)
+        port_bytes = int(port).to_bytes(2, "big")
+    except (OSError, TypeError, ValueError, OverflowError):
+        return None
+    family_bytes = family.to_bytes(2, sys.byteorder)
+    if family == socket.AF_INET:
+        return family_bytes + port_bytes + packed + bytes(8)
+    flowinfo = addr[2] if len(addr) > 2 else 0
+    scope_id = addr[3] if len(addr) > 3 else 0
+    return (
+        family_bytes
+        + port_bytes
+        + int(flowinfo).to_bytes(4, "big")
+        + packed
+        + int(scope_id).to_bytes(4, sys.byteorder)
+    )
+
+
+class BatchSender:
+    """Send a list of datagrams with as few sendmmsg(2) calls as possible.
+
+    Packets whose address is not a numeric literal for the socket family are
+    sent with sendto in their queue position, so ordering is preserved.
+    Encoded sockaddrs are memoised per destination, as peers are few and
+    receive many packets each.
+    """
+
+    def __init__(self, sock: socket.socket, max_messages: int = 100):
+        self.sock = sock
+        self.max_messages = max_messages
+        self._msgvec: Optional[ctypes.Array] = None
+        self._names: Dict[Address, Optional[bytes]] = {}
+        if _sendmmsg is None or sock.gettimeout() is not None:
+            return
+        self._iovecs = (_IOVec * max_messages)()
+        self._msgvec = (_MMsgHdr * max_messages)()
+        for idx in range(max_messages):
+            self._msgvec[idx].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[idx])
+            self._msgvec[idx].msg_hdr.msg_iovlen = 1
+
+    def send(self, packets: List[Tuple[bytes, Address]]) -> List[Tuple[Address, OSError]]:
+        """Send ``packets`` in order; returns the (addr, error) pairs that failed."""
+        failures: List[Tuple[Address, OSError]] = []
+        if self._msgvec is None:
+            for payload, addr in packets:
+                try:
+                    self.sock.sendto(payload, addr)
+                except OSError as exc:
+                    failures.append((addr, exc))
+            return failures
+
+        family = self.sock.family
+        names = self._names
+        pending: List[Tuple[bytes, bytes, Address]] = []
+        for payload, addr in packets:
+            try:
+                name = names[addr]
+            except KeyError:
+                name = _encode_address(family, addr)
+                if len(names) >= _ADDRESS_CACHE_LIMIT:
+                    names.clear()
+                names[addr] = name
+            except TypeError:
+                # unhashable address (e.g. a list); encode it without caching
+                name = _encode_address(family, addr)
+            if name is None:
+                self._flush(pending, failures)
+                try:
+                    self.sock.sendto(payload, addr)
+                except OSError as exc:
+                    failures.append((addr, exc))
+                continue
+            pending.append((payload, name, addr))
+            if len(pending) == self.max_messages:
+                self._flush(pending, failures)
+        self._flush(pending, failures)
+        return failures
+
+    def _flush(
+        self,
+        pending: List[Tuple[bytes, bytes, Address]],
+        failures: List[Tuple[Address, OSError]],
+    ) -> None:
+        if not pending:
+            return
+        msgvec = self._msgvec
+        # ctypes views borrow the bytes buffers; keep them referenced until sent
+        keep = []
+        for idx, (payload, name, _) in enumerate(pending):
+            payload_buf = ctypes.c_char_p(payload)
+            name_buf = ctypes.c_char_p(name)
+            keep.append((payload_buf, name_buf))
+            self._iovecs[idx].iov_base = ctypes.cast(payload_buf, ctypes.c_void_p)
+            self._iovecs[idx].iov_len = len(payload)
+            hdr = msgvec[idx].msg_hdr
+            hdr.msg_name = ctypes.cast(name_buf, ctypes.c_void_p)
+            hdr.msg_namelen = len(name)
+
+        fd = self.sock.fileno()
+        start = 0
+        total = len(pending)
+        while start < total:
+            sent = _sendmmsg(fd, ctypes.byref(msgvec[start]), total - start, 0)
+            if sent < 0:
+                err = ctypes.get_errno()
+                if err == errno.EINTR:
+                    continue
+                # the first unsent packet failed; report it and carry on after it
+                failures.append((pending[start][2], OSError(err, os.strerror(err))))
+                start += 1
+                continue
+            start += sent
+        pending.clear()
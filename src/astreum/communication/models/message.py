@@ -5,6 +5,10 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PublicKey
 from astreum.crypto import chacha20poly1305
 
+_HANDSHAKE_PREFIX = b"\x01"
+_ENCRYPTED_PREFIX = b"\x00"
+
+
 class MessageTopic(IntEnum):
     PING = 0
     OBJECT_REQUEST = 1
@@ -14,6 +18,9 @@ class MessageTopic(IntEnum):
     TRANSACTION = 5
 
 
+_TOPIC_BYTES = {topic: bytes((topic.value,)) for topic in MessageTopic}
+
+
 class Message:
     def __init__(
         self,
@@ -35,6 +42,8 @@ class Message:
         self.topic = topic
         self.content = content if content is not None else b""
         self.encrypted = encrypted
+        # wire packet assembled by encrypt(), valid while sender/encrypted are unchanged
+        self._packet: Optional[bytes] = None
 
         if self.handshake:
             if sender_bytes is None and sender is None:
@@ -59,12 +68,19 @@ class Message:
     def to_bytes(self):
         if self.handshake:
             # handshake byte (1) + raw public key bytes + payload
-            return bytes([1]) + self.sender_bytes + self.content
+            return b"".join((_HANDSHAKE_PREFIX, self.sender_bytes, self.content))
         else:
             # normal message: 0 + sender + encrypted payload (nonce + ciphertext)
             if not self.encrypted:
                 raise ValueError("non-handshake Message missing encrypted payload; call encrypt() first")
-            return bytes([0]) + self.sender_bytes + self.encrypted
+            packet = self._packet
+            if (
+                packet is not None
+                and self.encrypted is self._packet_encrypted
+                and self.sender_bytes is self._packet_sender
+            ):
+                return packet
+            return b"".join((_ENCRYPTED_PREFIX, self.sender_bytes, self.encrypted))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "Message":
@@ -85,10 +101,12 @@ class Message:
             if len(data) <= 33:
                 raise ValueError("Cannot parse Message: missing encrypted payload")
 
+            # the payload is only ever read by decrypt; view it in place
+            # rather than copying the datagram tail
             return Message(
                 handshake=False,
                 sender_bytes=data[1:33],
-                encrypted=data[33:],
+                encrypted=memoryview(data)[33:],
             )
 
     def encrypt(self, shared_key_bytes: bytes) -> None:
@@ -102,9 +120,16 @@ class Message:
             raise ValueError("Cannot encrypt message without a topic")
 
         nonce = os.urandom(12)
-        data_to_encrypt = bytes([self.topic.value]) + self.content
+        data_to_encrypt = b"".join((_TOPIC_BYTES[self.topic], self.content))
         ciphertext = chacha20poly1305.encrypt(shared_key_bytes, nonce, data_to_encrypt)
-        self.encrypted = nonce + ciphertext
+        # lay the ciphertext out in its final packet once; ``encrypted`` views
+        # into it, so to_bytes() hands the same buffer to the socket uncopied
+        sender_bytes = self.sender_bytes
+        packet = b"".join((_ENCRYPTED_PREFIX, sender_bytes, nonce, ciphertext))
+        self.encrypted = memoryview(packet)[1 + len(sender_bytes):]
+        self._packet = packet
+        self._packet_encrypted = self.encrypted
+        self._packet_sender = sender_bytes
 
     def decrypt(self, shared_key_bytes: bytes) -> None:
         if self.handshake:
@@ -116,9 +141,11 @@ class Message:
         if not self.encrypted or len(self.encrypted) < 13:
             raise ValueError("Encrypted content missing or too short")
 
-        nonce = self.encrypted[:12]
-        ciphertext = self.encrypted[12:]
+        encrypted = memoryview(self.encrypted)
+        nonce = encrypted[:12]
+        ciphertext = encrypted[12:]
         decrypted = chacha20poly1305.decrypt(shared_key_bytes, nonce, ciphertext)
         topic_value = decrypted[0]
         self.topic = MessageTopic(topic_value)
-        self.content = decrypted[1:]
+        # handlers parse the content in place; those that keep it copy it out
+        self.content = memoryview(decrypted)[1:]
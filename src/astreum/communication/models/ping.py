@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 
+# validator flag (0/1) + latest block hash
+_PING = struct.Struct(">B32s")
+
 
 class PingFormatError(ValueError):
     """Raised when ping payload bytes are invalid."""
@@ -12,7 +16,7 @@ class Ping:
     is_validator: bool
     latest_block: bytes
 
-    PAYLOAD_SIZE = 33
+    PAYLOAD_SIZE = _PING.size
 
     def __post_init__(self) -> None:
         lb = bytes(self.latest_block or b"")
@@ -21,13 +25,13 @@ class Ping:
         self.latest_block = lb
 
     def to_bytes(self) -> bytes:
-        return (b"\x01" if self.is_validator else b"\x00") + self.latest_block
+        return _PING.pack(1 if self.is_validator else 0, self.latest_block)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "Ping":
         if len(data) != cls.PAYLOAD_SIZE:
             raise PingFormatError("ping payload must be exactly 33 bytes")
-        flag = data[0]
-        if flag not in (0, 1):
+        flag, latest_block = _PING.unpack(data)
+        if flag > 1:
             raise PingFormatError("ping validator flag must be 0 or 1")
-        return cls(is_validator=bool(flag), latest_block=data[1:])
+        return cls(is_validator=flag == 1, latest_block=latest_block)
@@ -1,32 +1,80 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PublicKey
 from .peer import Peer
-from ..util import xor_distance
 
 PeerKey = Union[X25519PublicKey, bytes, bytearray]
 
+LOOKUP_CACHE_LIMIT = 1024
+
 
 class Route:
-    def __init__(self, relay_public_key: X25519PublicKey, bucket_size: int = 16):
-        self.relay_public_key_bytes = relay_public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw,
-        )
+    def __init__(self, relay_public_key: PeerKey, bucket_size: int = 16, diverse: bool = True):
+        if isinstance(relay_public_key, (bytes, bytearray)):
+            self.relay_public_key_bytes = bytes(relay_public_key)
+        else:
+            self.relay_public_key_bytes = relay_public_key.public_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PublicFormat.Raw,
+            )
         self.bucket_size = bucket_size
+        # when a bucket is full, trade its most redundant key for a newcomer
+        # that spreads the bucket over more of its id range
+        self.diverse = diverse
         self.buckets: Dict[int, List[bytes]] = {
             i: [] for i in range(len(self.relay_public_key_bytes) * 8)
         }
         self.peers: Dict[bytes, Peer] = {}
+        # integer form of every bucketed key, computed once when the key is added
+        self._key_ints: Dict[bytes, int] = {}
+        # bumped on every membership change so derived data can tell it is stale
+        self.version = 0
+        # recent closest_peer_for_hash answers: target -> (version, closest key)
+        self._lookup_cache: Dict[bytes, Tuple[int, Optional[bytes]]] = {}
 
     @staticmethod
     def _matching_leading_bits(a: bytes, b: bytes) -> int:
+        if len(a) == len(b):
+            # one wide XOR; the shared prefix is everything above its top set bit
+            diff = int.from_bytes(a, "big") ^ int.from_bytes(b, "big")
+            return len(a) * 8 - diff.bit_length()
         for byte_index, (ba, bb) in enumerate(zip(a, b)):
             diff = ba ^ bb
             if diff:
                 return byte_index * 8 + (8 - diff.bit_length())
         return len(a) * 8
 
+    def _diverse_eviction(self, bucket: List[bytes], candidate_int: int) -> Optional[bytes]:
+        """Return the key ``candidate_int`` should replace in full ``bucket``, if any.
+
+        The victim is the key sharing the longest prefix with another member.
+        It is only replaced when the newcomer's longest prefix shared with the
+        remaining members is strictly shorter than the victim's, so a stable
+        bucket does not churn.
+        """
+        key_ints = self._key_ints
+        members = [key_ints[key] for key in bucket]
+        victim_idx = -1
+        victim_xor = 0
+        for idx, member in enumerate(members):
+            # XOR bit_length orders keys by the prefix they share (longer shared
+            # prefix = shorter XOR), so the minimum is the nearest neighbour
+            nearest = min(
+                (member ^ other).bit_length()
+                for other_idx, other in enumerate(members)
+                if other_idx != idx
+            )
+            if victim_idx < 0 or nearest < victim_xor:
+                victim_idx, victim_xor = idx, nearest
+        candidate_xor = min(
+            (candidate_int ^ member).bit_length()
+            for idx, member in enumerate(members)
+            if idx != victim_idx
+        )
+        if candidate_xor > victim_xor:
+            return bucket[victim_idx]
+        return None
+
     def _normalize_peer_key(self, peer_public_key: PeerKey) -> bytes:
         if isinstance(peer_public_key, X25519PublicKey):
             return peer_public_key.public_bytes(
@@ -43,24 +91,64 @@ class Route:
     def add_peer(self, peer_public_key: PeerKey, peer: Optional[Peer] = None):
         peer_public_key_bytes = self._normalize_peer_key(peer_public_key)
         bucket_idx = self._matching_leading_bits(self.relay_public_key_bytes, peer_public_key_bytes)
-        if len(self.buckets[bucket_idx]) < self.bucket_size:
-            bucket = self.buckets[bucket_idx]
-            if peer_public_key_bytes not in bucket:
+        bucket = self.buckets[bucket_idx]
+        # _key_ints holds exactly the bucketed keys, so membership is one dict
+        # probe rather than a scan of the bucket list
+        if peer_public_key_bytes not in self._key_ints:
+            key_int = int.from_bytes(peer_public_key_bytes, "big")
+            if len(bucket) < self.bucket_size:
                 bucket.append(peer_public_key_bytes)
-        if peer is not None:
+                self._key_ints[peer_public_key_bytes] = key_int
+                self.version += 1
+            elif self.diverse and self.bucket_size > 1 and peer is not None:
+                # a bare key (e.g. from a ping) has no session to reach it by,
+                # so it never pushes out a member that may have one
+                evicted = self._diverse_eviction(bucket, key_int)
+                if evicted is not None:
+                    bucket[bucket.index(evicted)] = peer_public_key_bytes
+                    del self._key_ints[evicted]
+                    self.peers.pop(evicted, None)
+                    self._key_ints[peer_public_key_bytes] = key_int
+                    self.version += 1
+        if peer is not None and self.peers.get(peer_public_key_bytes) is not peer:
             self.peers[peer_public_key_bytes] = peer
+            self.version += 1
 
     def remove_peer(self, peer_public_key: PeerKey):
         peer_public_key_bytes = self._normalize_peer_key(peer_public_key)
-        bucket_idx = self._matching_leading_bits(self.relay_public_key_bytes, peer_public_key_bytes)
-        bucket = self.buckets.get(bucket_idx)
-        if not bucket:
-            return
-        try:
-            bucket.remove(peer_public_key_bytes)
-        except ValueError:
-            pass
-        self.peers.pop(peer_public_key_bytes, None)
+        bucketed = self._key_ints.pop(peer_public_key_bytes, None) is not None
+        if bucketed:
+            bucket_idx = self._matching_leading_bits(self.relay_public_key_bytes, peer_public_key_bytes)
+            self.buckets[bucket_idx].remove(peer_public_key_bytes)
+        # pings remove non-validators on every packet; only a real removal
+        # should invalidate what was derived from the route
+        if self.peers.pop(peer_public_key_bytes, None) is not None or bucketed:
+            self.version += 1
+
+    def closest_per_bucket(self, target: bytes) -> List[bytes]:
+        """Return, for each non-empty bucket, the key with the minimal XOR distance to ``target``."""
+        if len(target) != len(self.relay_public_key_bytes):
+            return []
+        target_int = int.from_bytes(target, "big")
+        key_ints = self._key_ints
+        closest_keys: List[bytes] = []
+        # peer threads add and remove keys while handlers answer lookups, and
+        # remove_peer drops a key from _key_ints before its bucket; scan a
+        # snapshot of each bucket and skip keys removed mid-scan
+        for bucket in self.buckets.values():
+            closest_key: Optional[bytes] = None
+            closest_distance: Optional[int] = None
+            for key in tuple(bucket):
+                key_int = key_ints.get(key)
+                if key_int is None:
+                    continue
+                distance = target_int ^ key_int
+                if closest_distance is None or distance < closest_distance:
+                    closest_distance = distance
+                    closest_key = key
+            if closest_key is not None:
+                closest_keys.append(closest_key)
+        return closest_keys
 
     def closest_peer_for_hash(self, target_hash: bytes) -> Optional[Peer]:
         """Return the peer with the minimal XOR distance to ``target_hash``."""
@@ -71,18 +159,33 @@ class Route:
         if len(target) != len(self.relay_public_key_bytes):
             raise ValueError("target_hash must match peer key length (32 bytes)")
 
+        # the same atom ids are looked up repeatedly (request retries,
+        # forwarding); reuse the answer until the route changes. The version
+        # is read before the scan so that a change landing mid-scan leaves the
+        # stored answer tagged with the older version
+        version = self.version
+        lookup_cache = self._lookup_cache
+        cached = lookup_cache.get(target)
+        if cached is not None and cached[0] == version:
+            return self.peers.get(cached[1])
+
         closest_key: Optional[bytes] = None
         closest_distance: Optional[int] = None
 
-        for bucket in self.buckets.values():
-            for peer_key in bucket:
-                try:
-                    distance = xor_distance(target, peer_key)
-                except ValueError:
-                    continue
-                if closest_distance is None or distance < closest_distance:
-                    closest_distance = distance
-                    closest_key = peer_key
+        # bucketed keys are normalized to the target length and pre-converted,
+        # so each candidate costs one XOR; distances are unique per key. The
+        # incoming thread adds and removes peers while other threads look up,
+        # so scan a snapshot rather than the live dict
+        target_int = int.from_bytes(target, "big")
+        for peer_key, key_int in tuple(self._key_ints.items()):
+            distance = target_int ^ key_int
+            if closest_distance is None or distance < closest_distance:
+                closest_distance = distance
+                closest_key = peer_key
+
+        if len(lookup_cache) >= LOOKUP_CACHE_LIMIT:
+            lookup_cache.clear()
+        lookup_cache[target] = (version, closest_key)
 
         if closest_key is None:
             return None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import socket
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
 
 from ..handlers.handshake import handle_handshake
 from ..handlers.object_request import handle_object_request
@@ -10,89 +12,174 @@ from ..handlers.route_request import handle_route_request
 from ..handlers.route_response import handle_route_response
 from ..models.message import Message, MessageTopic
 from ..models.peer import Peer
+from ..mmsg import BatchReceiver
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PublicKey
 
 if TYPE_CHECKING:
     from .. import Node
-
-
-def process_incoming_messages(node: "Node") -> None:
-    """Process incoming messages (placeholder)."""
+    from ..util import PacketQueue
+
+
+def _handle_ping_message(node: "Node", peer: Peer, message: Message) -> None:
+    handle_ping(node, peer, message.content)
+
+
+def _handle_transaction_message(node: "Node", peer: Peer, message: Message) -> None:
+    if node.validation_secret_key is None:
+        return
+    node._validation_transaction_queue.put(bytes(message.content))
+
+
+# one dict probe per packet instead of walking a match ladder
+TOPIC_HANDLERS: Dict[MessageTopic, Callable[["Node", Peer, Message], None]] = {
+    MessageTopic.PING: _handle_ping_message,
+    MessageTopic.OBJECT_REQUEST: handle_object_request,
+    MessageTopic.OBJECT_RESPONSE: handle_object_response,
+    MessageTopic.ROUTE_REQUEST: handle_route_request,
+    MessageTopic.ROUTE_RESPONSE: handle_route_response,
+    MessageTopic.TRANSACTION: _handle_transaction_message,
+}
+
+
+# high-rate topics handled on their own thread, in arrival order per topic, so
+# storage lookups and atom hashing do not hold up pings and route traffic
+DEDICATED_TOPICS = (MessageTopic.OBJECT_REQUEST, MessageTopic.OBJECT_RESPONSE)
+
+INCOMING_BATCH_LIMIT = 64
+
+HANDLER_ERROR_LOG_INTERVAL = 1.0
+
+
+def _log_handler_error(
+    node: "Node",
+    last_logged: Dict[Tuple[MessageTopic, type], Tuple[float, int]],
+    topic: MessageTopic,
+    exc: Exception,
+) -> None:
+    """Log a handler failure at most once per interval per (topic, error type)."""
+    key = (topic, type(exc))
+    now = time.monotonic()
+    logged_at, suppressed = last_logged.get(key, (0.0, 0))
+    if now - logged_at < HANDLER_ERROR_LOG_INTERVAL:
+        last_logged[key] = (logged_at, suppressed + 1)
+        return
+    last_logged[key] = (now, 0)
+    node.logger.error(
+        "Error handling %s message: %s (%s similar errors suppressed)",
+        topic.name,
+        exc,
+        suppressed,
+    )
+
+
+def _run_handler(
+    node: "Node",
+    handler_errors: Dict[Tuple[MessageTopic, type], Tuple[float, int]],
+    peer: Peer,
+    message: Message,
+) -> None:
+    topic = message.topic
+    handler = TOPIC_HANDLERS.get(topic)
+    if handler is None:
+        return
+    # one guard for every handler: a malformed packet must not end this
+    # thread, and an error storm must not flood the log
+    try:
+        handler(node, peer, message)
+    except Exception as exc:
+        _log_handler_error(node, handler_errors, topic, exc)
+
+
+def process_topic_messages(node: "Node", topic: MessageTopic) -> None:
+    """Run the handler for one dedicated topic over its (peer, message) queue."""
+    handler_errors: Dict[Tuple[MessageTopic, type], Tuple[float, int]] = {}
+    topic_queue = node.topic_queues[topic]
     while True:
-        try:
-            data, addr = node.incoming_queue.get()
-        except Exception as exc:
-            node.logger.exception("Error taking from incoming queue")
-            continue
-
-        try:
-            message = Message.from_bytes(data)
-        except Exception as exc:
-            node.logger.warning("Error decoding message: %s", exc)
-            continue
-
-        if message.handshake:
-            if handle_handshake(node, addr, message):
-                continue
-        
+        for peer, message in topic_queue.get_batch(INCOMING_BATCH_LIMIT):
+            _run_handler(node, handler_errors, peer, message)
+
+
+def _process_packet(
+    node: "Node",
+    handler_errors: Dict[Tuple[MessageTopic, type], Tuple[float, int]],
+    topic_queues: Dict[MessageTopic, PacketQueue],
+    data: bytes,
+    addr: Tuple,
+) -> None:
+    try:
+        message = Message.from_bytes(data)
+    except Exception as exc:
+        node.logger.warning("Error decoding message: %s", exc)
+        return
+
+    if message.handshake:
+        if handle_handshake(node, addr, message):
+            return
+    
+    sender_bytes = message.sender_bytes
+    peer = None
+    try:
+        peer = node.get_peer(sender_bytes)
+    except Exception:
         peer = None
+    if peer is None:
         try:
-            peer = node.get_peer(message.sender_bytes)
+            peer_key = X25519PublicKey.from_public_bytes(sender_bytes)
+            host, port = addr[0], int(addr[1])
+            peer = Peer(
+                node_secret_key=node.relay_secret_key,
+                peer_public_key=peer_key,
+                address=(host, port),
+            )
         except Exception:
             peer = None
-        if peer is None:
-            try:
-                peer_key = X25519PublicKey.from_public_bytes(message.sender_bytes)
-                host, port = addr[0], int(addr[1])
-                peer = Peer(
-                    node_secret_key=node.relay_secret_key,
-                    peer_public_key=peer_key,
-                    address=(host, port),
-                )
-            except Exception:
-                peer = None
-
-        if peer is None:
-            node.logger.debug("Unable to resolve peer for message from %s", addr)
-            continue
-
-        # decrypt message payload before dispatch
-        try:
-            message.decrypt(peer.shared_key_bytes)
-        except Exception as exc:
-            node.logger.warning("Error decrypting message from %s: %s", peer.address, exc)
-            continue
 
-        match message.topic:
-            case MessageTopic.PING:
-                handle_ping(node, peer, message.content)
+    if peer is None:
+        node.logger.debug("Unable to resolve peer for message from %s", addr)
+        return
 
-            case MessageTopic.OBJECT_REQUEST:
-                handle_object_request(node, peer, message)
+    # decrypt message payload before dispatch
+    try:
+        message.decrypt(peer.shared_key_bytes)
+    except Exception as exc:
+        node.logger.warning("Error decrypting message from %s: %s", peer.address, exc)
+        return
 
-            case MessageTopic.OBJECT_RESPONSE:
-                handle_object_response(node, peer, message)
+    topic_queue = topic_queues.get(message.topic)
+    if topic_queue is not None:
+        topic_queue.put((peer, message))
+    else:
+        _run_handler(node, handler_errors, peer, message)
 
-            case MessageTopic.ROUTE_REQUEST:
-                handle_route_request(node, peer, message)
 
-            case MessageTopic.ROUTE_RESPONSE:
-                handle_route_response(node, peer, message)
+def process_incoming_messages(node: "Node") -> None:
+    """Process incoming messages (placeholder).
 
-            case MessageTopic.TRANSACTION:
-                if node.validation_secret_key is None:
-                    continue
-                node._validation_transaction_queue.put(message.content)
+    Packets are taken in batches of up to INCOMING_BATCH_LIMIT, so a burst
+    costs one wakeup rather than one per datagram.
+    """
+    handler_errors: Dict[Tuple[MessageTopic, type], Tuple[float, int]] = {}
+    topic_queues = getattr(node, "topic_queues", {})
+    while True:
+        try:
+            batch = node.incoming_queue.get_batch(INCOMING_BATCH_LIMIT)
+        except Exception as exc:
+            node.logger.exception("Error taking from incoming queue")
+            continue
 
-            case _:
-                continue
+        for data, addr in batch:
+            _process_packet(node, handler_errors, topic_queues, data, addr)
 
 
-def populate_incoming_messages(node: "Node") -> None:
-    """Receive UDP packets and feed the incoming queue."""
+def populate_incoming_messages(node: "Node", sock: Optional[socket.socket] = None) -> None:
+    """Receive UDP packets from ``sock`` (default: the node's incoming socket) and feed the incoming queue."""
+    receiver = BatchReceiver(
+        sock if sock is not None else node.incoming_socket,
+        max_messages=getattr(node, "incoming_batch_size", 64),
+        bufsize=getattr(node, "max_message_size", 4096),
+    )
     while True:
         try:
-            data, addr = node.incoming_socket.recvfrom(4096)
-            node.incoming_queue.put((data, addr))
+            node.incoming_queue.put_many(receiver.recv())
         except Exception as exc:
             node.logger.warning("Error populating incoming queue: %s", exc)
@@ -2,19 +2,32 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Tuple
 
+from ..mmsg import BatchSender
+
 if TYPE_CHECKING:
     from .. import Node
 
+OUTGOING_BATCH_LIMIT = 100
+
+
 def process_outgoing_messages(node: "Node") -> None:
-    """Send queued outbound packets."""
+    """Send queued outbound packets.
+
+    Blocks for the first packet, then drains whatever else is already queued
+    (up to OUTGOING_BATCH_LIMIT) and hands the batch to a single sendmmsg call.
+    """
+    sender = BatchSender(node.outgoing_socket, max_messages=OUTGOING_BATCH_LIMIT)
     while True:
         try:
-            payload, addr = node.outgoing_queue.get()
+            batch = node.outgoing_queue.get_batch(OUTGOING_BATCH_LIMIT)
         except Exception:
             node.logger.exception("Error taking from outgoing queue")
             continue
 
         try:
-            node.outgoing_socket.sendto(payload, addr)
+            failures = sender.send(batch)
         except Exception as exc:
+            node.logger.warning("Error sending %s queued messages: %s", len(batch), exc)
+            continue
+        for addr, exc in failures:
             node.logger.warning("Error sending message to %s: %s", addr, exc)
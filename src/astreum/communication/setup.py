@@ -1,6 +1,5 @@
-import socket, threading
-from queue import Queue
-from typing import Tuple, Optional
+import os, socket, sys, threading
+from typing import Tuple, Optional, Union
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives.asymmetric.x25519 import (
@@ -13,8 +12,11 @@ if TYPE_CHECKING:
     from .. import Node
 
 from . import Route, Message
+from .util import PacketQueue
 from .processors.incoming import (
+    DEDICATED_TOPICS,
     process_incoming_messages,
+    process_topic_messages,
     populate_incoming_messages,
 )
 from .processors.outgoing import process_outgoing_messages
@@ -33,14 +35,82 @@ def load_ed25519(hex_key: Optional[str]) -> Optional[ed25519.Ed25519PrivateKey]:
            if hex_key else None
 
 def make_routes(
-    relay_pk: X25519PublicKey,
-    val_sk: Optional[ed25519.Ed25519PrivateKey]
+    relay_pk: Union[X25519PublicKey, bytes],
+    val_sk: Optional[ed25519.Ed25519PrivateKey],
+    diverse: bool = True,
 ) -> Tuple[Route, Optional[Route]]:
     """Peer route (DH pubkey) + optional validation route (ed pubkey)."""
-    peer_rt = Route(relay_pk)
-    val_rt  = Route(val_sk.public_key()) if val_sk else None
+    peer_rt = Route(relay_pk, diverse=diverse)
+    val_rt  = Route(val_sk.public_key(), diverse=diverse) if val_sk else None
     return peer_rt, val_rt
 
+def _make_incoming_socket(use_ipv6: bool, reuse_port: bool) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if use_ipv6 else socket.AF_INET, socket.SOCK_DGRAM)
+    if use_ipv6:
+        sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    return sock
+
+# Linux SO_NO_CHECK; the socket module does not export it
+_SO_NO_CHECK = getattr(socket, "SO_NO_CHECK", 11)
+
+def _disable_udp_checksum(node: "Node") -> None:
+    """Skip UDP checksums on outbound IPv4 datagrams (Linux only, opt-in).
+
+    Sealed payloads carry a ChaCha20-Poly1305 tag that rejects corrupted
+    datagrams, but handshakes and route responses leave on the same socket
+    unsealed, so a flipped bit in a sender key or port would go unnoticed.
+    Only enable this on links that are trusted not to corrupt packets. The
+    kernel still verifies non-zero checksums from peers, and IPv6 forbids
+    zero checksums altogether.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        node.outgoing_socket.setsockopt(socket.SOL_SOCKET, _SO_NO_CHECK, 1)
+    except OSError as exc:
+        node.logger.debug("Unable to disable UDP checksums: %s", exc)
+
+# default kernel buffering per socket, enough to absorb a burst; 0 keeps the OS default
+DEFAULT_SOCKET_BUFFER_SIZE = 4 << 20
+
+def _set_socket_buffer(node: "Node", sock: socket.socket, option: int, size: Optional[int]) -> None:
+    """Ask the kernel for a larger socket buffer; it may clamp to rmem_max/wmem_max."""
+    if not size:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, option, int(size))
+    except OSError as exc:
+        node.logger.debug("Unable to set socket buffer to %s bytes: %s", size, exc)
+
+def _pin_threads(node: "Node") -> None:
+    """Pin receivers, the sender and the processors to separate CPUs (Linux only).
+
+    Receivers share the first allowed CPU, the sender takes the second and
+    the processing threads are spread round-robin over the rest, so a busy
+    worker does not push a receiver off its core while datagrams pile up.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        node.logger.debug("Thread pinning unavailable on this platform")
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < 2:
+        node.logger.debug("Thread pinning skipped; only %s CPU available", len(cpus))
+        return
+    workers = cpus[2:] or cpus
+    processors = [node.incoming_process_thread, *node.topic_threads.values()]
+    assignments = [(thread, cpus[0]) for thread in node.incoming_populate_threads]
+    assignments.append((node.outgoing_thread, cpus[1]))
+    assignments.extend(
+        (thread, workers[idx % len(workers)]) for idx, thread in enumerate(processors)
+    )
+    for thread, cpu in assignments:
+        try:
+            os.sched_setaffinity(thread.native_id, {cpu})
+        except OSError as exc:
+            node.logger.debug("Unable to pin thread %s to CPU %s: %s", thread.name, cpu, exc)
+
 def make_maps():
     """Empty lookup maps: peers and addresses."""
     return
@@ -70,8 +140,9 @@ def communication_setup(node: "Node", config: dict):
         else None
     )
     node.peer_route, node.validation_route = make_routes(
-        node.relay_public_key,
-        node.validation_secret_key
+        node.relay_public_key_bytes,
+        node.validation_secret_key,
+        diverse=bool(config.get('diverse_buckets', True)),
     )
 
     # connection state & atom request tracking
@@ -81,36 +152,89 @@ def communication_setup(node: "Node", config: dict):
 
     # sockets + queues + threads
     incoming_port = config.get('incoming_port', 7373)
-    fam = socket.AF_INET6 if node.use_ipv6 else socket.AF_INET
-    node.incoming_socket = socket.socket(fam, socket.SOCK_DGRAM)
-    if node.use_ipv6:
-        node.incoming_socket.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
-    node.incoming_socket.bind(("::" if node.use_ipv6 else "0.0.0.0", incoming_port or 0))
-    node.incoming_port = node.incoming_socket.getsockname()[1]
+    bind_host = "::" if node.use_ipv6 else "0.0.0.0"
+    # extra receivers share the port via SO_REUSEPORT and the kernel spreads
+    # datagrams across them by flow hash; off by default since any process of
+    # the same user could then bind the port too
+    receiver_count = max(1, int(config.get('incoming_receivers', 1)))
+    # bytes of kernel buffering per socket; bursts beyond it are dropped
+    socket_buffer_size = config.get('socket_buffer_size', DEFAULT_SOCKET_BUFFER_SIZE)
+    if receiver_count > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        node.logger.warning("SO_REUSEPORT unavailable; using a single incoming receiver")
+        receiver_count = 1
+
+    node.incoming_sockets = []
+    for _ in range(receiver_count):
+        sock = _make_incoming_socket(node.use_ipv6, reuse_port=receiver_count > 1)
+        _set_socket_buffer(node, sock, socket.SO_RCVBUF, socket_buffer_size)
+        # the first bind may pick an ephemeral port; the rest join it
+        sock.bind((bind_host, incoming_port or 0))
+        incoming_port = sock.getsockname()[1]
+        node.incoming_sockets.append(sock)
+    node.incoming_socket = node.incoming_sockets[0]
+    node.incoming_port = incoming_port
+    # the bound address never changes; read it once rather than per advertisement
+    node.incoming_address = node.incoming_socket.getsockname()[:2]
     node.logger.info(
-        "Incoming UDP socket bound to %s:%s",
-        "::" if node.use_ipv6 else "0.0.0.0",
+        "Incoming UDP socket bound to %s:%s (receivers=%s)",
+        bind_host,
         node.incoming_port,
+        receiver_count,
     )
-    node.incoming_queue = Queue()
-    node.incoming_populate_thread = threading.Thread(
-        target=populate_incoming_messages,
-        args=(node,),
-        daemon=True,
-    )
+    # every handshake we send (bootstrap or reply) is the same packet; encode
+    # it before the receivers start so handlers can reuse it
+    node.handshake_bytes = Message(
+        handshake=True,
+        sender_bytes=node.relay_public_key_bytes,
+        content=int(node.config["incoming_port"]).to_bytes(2, "big", signed=False),
+    ).to_bytes()
+
+    # ROUTE_REQUEST answers per (route id, sender), reused for route_cache_ttl seconds
+    node.route_response_cache = {}
+    node.route_cache_ttl = float(config.get('route_cache_ttl', 1.0))
+
+    # datagrams handed back per recvmmsg call on each receiver
+    node.incoming_batch_size = max(1, int(config.get('incoming_batch_size', 64)))
+    # per-datagram receive buffer; longer datagrams are truncated, as with recvfrom
+    node.max_message_size = max(1, int(config.get('max_message_size', 4096)))
+    node.incoming_queue = PacketQueue()
+    node.incoming_populate_threads = [
+        threading.Thread(
+            target=populate_incoming_messages,
+            args=(node, sock),
+            daemon=True,
+        )
+        for sock in node.incoming_sockets
+    ]
+    node.incoming_populate_thread = node.incoming_populate_threads[0]
     node.incoming_process_thread = threading.Thread(
         target=process_incoming_messages,
         args=(node,),
         daemon=True,
     )
-    node.incoming_populate_thread.start()
+    node.topic_queues = {topic: PacketQueue() for topic in DEDICATED_TOPICS}
+    node.topic_threads = {
+        topic: threading.Thread(
+            target=process_topic_messages,
+            args=(node, topic),
+            daemon=True,
+        )
+        for topic in DEDICATED_TOPICS
+    }
+    for thread in node.topic_threads.values():
+        thread.start()
+    for thread in node.incoming_populate_threads:
+        thread.start()
     node.incoming_process_thread.start()
 
     node.outgoing_socket = socket.socket(
         socket.AF_INET6 if node.use_ipv6 else socket.AF_INET,
         socket.SOCK_DGRAM,
     )
-    node.outgoing_queue = Queue()
+    _set_socket_buffer(node, node.outgoing_socket, socket.SO_SNDBUF, socket_buffer_size)
+    if config.get('disable_udp_checksum', False) and not node.use_ipv6:
+        _disable_udp_checksum(node)
+    node.outgoing_queue = PacketQueue()
 
     node.outgoing_thread = threading.Thread(
         target=process_outgoing_messages,
@@ -118,14 +242,21 @@ def communication_setup(node: "Node", config: dict):
         daemon=True,
     )
     node.outgoing_thread.start()
+    if config.get('pin_threads', False):
+        _pin_threads(node)
 
     # other workers & maps
     # track atom requests we initiated; guarded by atom_requests_lock on the node
-    node.peer_manager_thread  = threading.Thread(
-        target=node._relay_peer_manager,
-        daemon=True
-    )
-    node.peer_manager_thread.start()
+    # no peer manager ships with the node yet; only spawn a thread when one is
+    # installed instead of starting (or failing on) a placeholder
+    node.peer_manager_thread = None
+    peer_manager = getattr(node, "_relay_peer_manager", None)
+    if peer_manager is not None:
+        node.peer_manager_thread = threading.Thread(
+            target=peer_manager,
+            daemon=True
+        )
+        node.peer_manager_thread.start()
 
     with node.peers_lock:
         node.peers, node.addresses = {}, {} # peers: Dict[bytes,Peer], addresses: Dict[(str,int),bytes]
@@ -149,12 +280,7 @@ def communication_setup(node: "Node", config: dict):
             node.logger.warning("Invalid bootstrap address %s: %s", addr, exc)
             continue
 
-        handshake_message = Message(
-            handshake=True,
-            sender=node.relay_public_key,
-            content=int(node.config["incoming_port"]).to_bytes(2, "big", signed=False),
-        )
-        node.outgoing_queue.put((handshake_message.to_bytes(), (host, port)))
+        node.outgoing_queue.put((node.handshake_bytes, (host, port)))
         node.logger.info("Sent bootstrap handshake to %s:%s", host, port)
 
     node.logger.info(
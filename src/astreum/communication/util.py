@@ -1,4 +1,7 @@
-from typing import Tuple
+import threading
+from collections import deque
+from queue import Empty
+from typing import Any, Iterable, List, Tuple
 
 
 def address_str_to_host_and_port(address: str) -> Tuple[str, int]:
@@ -46,4 +49,67 @@ def xor_distance(a: bytes, b: bytes) -> int:
     """Return the unsigned integer XOR distance between two equal-length identifiers."""
     if len(a) != len(b):
         raise ValueError("xor distance requires operands of equal length")
-    return int.from_bytes(bytes(x ^ y for x, y in zip(a, b)), "big", signed=False)
+    return int.from_bytes(a, "big") ^ int.from_bytes(b, "big")
+
+
+class PacketQueue:
+    """Many-producer/single-consumer FIFO for the UDP receive and send paths.
+
+    deque append/extend/popleft are atomic under the GIL, so any number of
+    receiver threads can feed it and the only synchronisation is an Event the
+    consumer sleeps on when the buffer runs dry. Unlike queue.Queue this takes
+    no lock per item on the hot path.
+    """
+
+    def __init__(self) -> None:
+        self._items: "deque[Any]" = deque()
+        self._ready = threading.Event()
+
+    def put(self, item: Any) -> None:
+        self._items.append(item)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Append a batch and wake the consumer once."""
+        self._items.extend(items)
+        if self._items and not self._ready.is_set():
+            self._ready.set()
+
+    def get(self) -> Any:
+        """Remove and return the oldest item, blocking until one is available."""
+        items = self._items
+        while True:
+            try:
+                return items.popleft()
+            except IndexError:
+                pass
+            self._ready.clear()
+            # re-check after clearing so a put racing the clear is not missed
+            if items:
+                continue
+            self._ready.wait()
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest item, raising queue.Empty if there is none."""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise Empty from None
+
+    def get_batch(self, limit: int) -> List[Any]:
+        """Block for one item, then also take whatever else is queued, up to ``limit``."""
+        batch = [self.get()]
+        items = self._items
+        while len(batch) < limit:
+            try:
+                batch.append(items.popleft())
+            except IndexError:
+                break
+        return batch
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
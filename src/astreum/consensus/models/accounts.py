@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from ...storage.models.atom import Atom, ZERO32
 from ...storage.models.trie import Trie
+from ...utils.integer import bytes_to_int, int_to_bytes
 from .account import Account
 
 
@@ -14,6 +15,8 @@ class Accounts:
     ) -> None:
         self._trie = Trie(root_hash=root_hash)
         self._cache: Dict[bytes, Account] = {}
+        # account address -> data trie key -> integer amount still to be added
+        self._data_credits: Dict[bytes, Dict[bytes, int]] = {}
 
     @property
     def root_hash(self) -> Optional[bytes]:
@@ -38,6 +41,26 @@ class Accounts:
     def set_account(self, address: bytes, account: Account) -> None:
         self._cache[address] = account
 
+    def credit_data(self, address: bytes, key: bytes, amount: int) -> None:
+        """
+        Add ``amount`` to the integer stored under ``key`` in the account's data
+        trie. Credits are summed per key and written once in update_trie, so a
+        run of deposits to the same key costs a single trie put.
+        """
+        credits = self._data_credits.setdefault(address, {})
+        credits[key] = credits.get(key, 0) + amount
+
+    def _apply_data_credits(self, node: Any) -> None:
+        for address, credits in self._data_credits.items():
+            account = self.get_account(address, node)
+            if account is None:
+                raise ValueError("data credit staged for unknown account")
+            data_trie = account.data
+            for key, amount in credits.items():
+                current = bytes_to_int(data_trie.get(node, key))
+                data_trie.put(node, key, int_to_bytes(current + amount))
+        self._data_credits.clear()
+
     def update_trie(self, node: Any) -> List[Atom]:
         """
         Serialise cached accounts, ensure their associated data tries are materialised,
@@ -57,6 +80,8 @@ class Accounts:
                 emitted.extend(atoms)
             return emitted
 
+        self._apply_data_credits(node)
+
         data_atoms: List[Atom] = []
         account_atoms: List[Atom] = []
 
@@ -1,7 +1,17 @@
 
-from typing import Any, Callable, List, Optional, Tuple, TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
-from ...storage.models.atom import Atom, AtomKind, ZERO32, hash_bytes
+from blake3 import blake3
+
+from ...storage.models.atom import (
+    Atom,
+    AtomKind,
+    ZERO32,
+    hash_bytes,
+    object_id_from_parts,
+)
 
 if TYPE_CHECKING:
     from ...storage.models.trie import Trie
@@ -15,10 +25,8 @@ def _int_to_be_bytes(n: Optional[int]) -> bytes:
     if n is None:
         return b""
     n = int(n)
-    if n == 0:
-        return b"\x00"
-    size = (n.bit_length() + 7) // 8
-    return n.to_bytes(size, "big")
+    # zero has bit_length 0 and still encodes as a single byte
+    return n.to_bytes((n.bit_length() + 7) >> 3 or 1, "big")
 
 
 def _be_bytes_to_int(b: Optional[bytes]) -> int:
@@ -27,6 +35,45 @@ def _be_bytes_to_int(b: Optional[bytes]) -> int:
     return int.from_bytes(b, "big")
 
 
+_BLOCK_TYPE = b"block"
+_BLOCK_TYPE_HASH = hash_bytes(_BLOCK_TYPE)
+
+# (validator_public_key, signature, body_hash) triples that already verified,
+# oldest first; bounded so resyncs cannot grow it without limit
+_VERIFIED_SIGNATURES_LIMIT = 4096
+_verified_signatures: "OrderedDict[Tuple[bytes, bytes, bytes], None]" = OrderedDict()
+_verified_signatures_lock = threading.Lock()
+
+
+def _signature_verified(key: Tuple[bytes, bytes, bytes]) -> bool:
+    with _verified_signatures_lock:
+        return key in _verified_signatures
+
+
+def _remember_signature(key: Tuple[bytes, bytes, bytes]) -> None:
+    with _verified_signatures_lock:
+        _verified_signatures[key] = None
+        if len(_verified_signatures) > _VERIFIED_SIGNATURES_LIMIT:
+            _verified_signatures.popitem(last=False)
+
+
+# bound on each node's block_fields_cache (decoded header/body fields per
+# block id); block ids are content hashes, so an entry never goes stale
+DECODED_BLOCKS_LIMIT = 1024
+
+
+def _load_public_key(
+    key_bytes: bytes, cache: Optional[Dict[bytes, Ed25519PublicKey]]
+) -> Ed25519PublicKey:
+    if cache is None:
+        return Ed25519PublicKey.from_public_bytes(key_bytes)
+    pub = cache.get(key_bytes)
+    if pub is None:
+        pub = Ed25519PublicKey.from_public_bytes(key_bytes)
+        cache[key_bytes] = pub
+    return pub
+
+
 class Block:
     """Validation Block representation using Atom storage.
 
@@ -35,7 +82,10 @@ class Block:
       chain: type_atom --next--> signature_atom --next--> body_list_atom --next--> ZERO32
       where: type_atom        = Atom(kind=AtomKind.SYMBOL, data=b"block")
              signature_atom   = Atom(kind=AtomKind.BYTES, data=<signature-bytes>)
-             body_list_atom   = Atom(kind=AtomKind.LIST,  data=<body_head_id>)
+             body_list_atom   = Atom(kind=AtomKind.LIST,  data=<detail_id_0 || ... || detail_id_10>)
+
+    The body list carries the 32-byte ids of the detail atoms concatenated in
+    order; each detail is a standalone BYTES atom with next_id = ZERO32.
 
     Details order in body_list:
       0: chain                               (byte)
@@ -58,6 +108,27 @@ class Block:
         unless explicitly provided via details extension in the future.
     """
 
+    __slots__ = (
+        "atom_hash",
+        "chain_id",
+        "previous_block_hash",
+        "previous_block",
+        "number",
+        "timestamp",
+        "accounts_hash",
+        "transactions_total_fees",
+        "transactions_hash",
+        "receipts_hash",
+        "delay_difficulty",
+        "validator_public_key",
+        "nonce",
+        "body_hash",
+        "signature",
+        "accounts",
+        "transactions",
+        "receipts",
+    )
+
     # essential identifiers
     atom_hash: Optional[bytes]
     chain_id: int
@@ -125,69 +196,117 @@ class Block:
         self.transactions = transactions
         self.receipts = receipts
 
-    def to_atom(self) -> Tuple[bytes, List[Atom]]:
-        # Build body details as direct byte atoms, in defined order
-        detail_payloads: List[bytes] = []
-        block_atoms: List[Atom] = []
-
-        def _emit(detail_bytes: bytes) -> None:
-            detail_payloads.append(detail_bytes)
-
-        # 0: chain
-        _emit(_int_to_be_bytes(self.chain_id))
-        # 1: previous_block_hash
-        _emit(self.previous_block_hash)
-        # 2: number
-        _emit(_int_to_be_bytes(self.number))
-        # 3: timestamp
-        _emit(_int_to_be_bytes(self.timestamp))
-        # 4: accounts_hash
-        _emit(self.accounts_hash or b"")
-        # 5: transactions_total_fees
-        _emit(_int_to_be_bytes(self.transactions_total_fees))
-        # 6: transactions_hash
-        _emit(self.transactions_hash or b"")
-        # 7: receipts_hash
-        _emit(self.receipts_hash or b"")
-        # 8: delay_difficulty
-        _emit(_int_to_be_bytes(self.delay_difficulty))
-        # 9: validator_public_key
-        _emit(self.validator_public_key or b"")
-        # 10: nonce
-        _emit(_int_to_be_bytes(self.nonce))
-
-        # Build body list chain directly from detail atoms
-        body_head = ZERO32
-        detail_atoms: List[Atom] = []
-        for payload in reversed(detail_payloads):
-            atom = Atom(data=payload, next_id=body_head, kind=AtomKind.BYTES)
-            detail_atoms.append(atom)
-            body_head = atom.object_id()
-        detail_atoms.reverse()
-
-        block_atoms.extend(detail_atoms)
-
-        body_list_atom = Atom(data=body_head, kind=AtomKind.LIST)
-        self.body_hash = body_list_atom.object_id()
+    def _detail_payloads(self) -> List[bytes]:
+        """Return the encoded body details in their defined order."""
+        return [
+            _int_to_be_bytes(self.chain_id),                 # 0: chain
+            self.previous_block_hash,                        # 1: previous_block_hash
+            _int_to_be_bytes(self.number),                   # 2: number
+            _int_to_be_bytes(self.timestamp),                # 3: timestamp
+            self.accounts_hash or b"",                       # 4: accounts_hash
+            _int_to_be_bytes(self.transactions_total_fees),  # 5: transactions_total_fees
+            self.transactions_hash or b"",                   # 6: transactions_hash
+            self.receipts_hash or b"",                       # 7: receipts_hash
+            _int_to_be_bytes(self.delay_difficulty),         # 8: delay_difficulty
+            self.validator_public_key or b"",                # 9: validator_public_key
+            _int_to_be_bytes(self.nonce),                    # 10: nonce
+        ]
+
+    def _signature_payload(self) -> bytes:
+        """Return the signature atom payload (empty for unsigned blocks)."""
+        signature = self.signature
+        if not signature:
+            return b""
+        return signature if type(signature) is bytes else bytes(signature)
+
+    @staticmethod
+    def _detail_id(payload: bytes) -> bytes:
+        """Compute the id of a standalone BYTES detail atom."""
+        return object_id_from_parts(AtomKind.BYTES, hash_bytes(payload), ZERO32, len(payload))
+
+    @staticmethod
+    def _header_ids(
+        body_data: bytes,
+        signature: bytes,
+        signature_hash: bytes,
+    ) -> Tuple[bytes, bytes, bytes]:
+        """Compute body hash, signature id and block id from raw parts.
+
+        Only hashes are produced; no Atom objects are built.
+        """
+        body_hash = object_id_from_parts(
+            AtomKind.LIST, hash_bytes(body_data), ZERO32, len(body_data)
+        )
+        sig_id = object_id_from_parts(
+            AtomKind.BYTES, signature_hash, body_hash, len(signature)
+        )
+        block_id = object_id_from_parts(
+            AtomKind.SYMBOL, _BLOCK_TYPE_HASH, sig_id, len(_BLOCK_TYPE)
+        )
+        return body_hash, sig_id, block_id
+
+    def to_atom(
+        self,
+        *,
+        detail_atoms: Optional[Dict[bytes, Atom]] = None,
+    ) -> Tuple[bytes, List[Atom]]:
+        """Encode this block, returning its id and atoms.
 
-        # Signature atom links to body list atom; type atom links to signature atom
+        ``detail_atoms`` optionally maps detail payloads to already-built atoms
+        so encodes sharing it reuse (and hash once) equal details.
+        """
+        # Each atom is hashed exactly once here; callers storing the returned
+        # atoms reuse the memoized ids instead of hashing them again.
+        if detail_atoms is None:
+            block_atoms: List[Atom] = [
+                Atom(data=payload, kind=AtomKind.BYTES) for payload in self._detail_payloads()
+            ]
+        else:
+            block_atoms = []
+            for payload in self._detail_payloads():
+                atom = detail_atoms.get(payload)
+                if atom is None:
+                    atom = Atom(data=payload, kind=AtomKind.BYTES)
+                    detail_atoms[payload] = atom
+                block_atoms.append(atom)
+        body_list_atom = Atom(
+            data=b"".join(atom.object_id() for atom in block_atoms),
+            kind=AtomKind.LIST,
+        )
         sig_atom = Atom(
-            data=bytes(self.signature or b""),
-            next_id=self.body_hash,
+            data=self._signature_payload(),
+            next_id=body_list_atom.object_id(),
             kind=AtomKind.BYTES,
         )
-        type_atom = Atom(data=b"block", next_id=sig_atom.object_id(), kind=AtomKind.SYMBOL)
+        type_atom = Atom(data=_BLOCK_TYPE, next_id=sig_atom.object_id(), kind=AtomKind.SYMBOL)
+        block_atoms.extend((body_list_atom, sig_atom, type_atom))
 
-        block_atoms.append(body_list_atom)
-        block_atoms.append(sig_atom)
-        block_atoms.append(type_atom)
-
+        self.body_hash = body_list_atom.object_id()
         self.atom_hash = type_atom.object_id()
         return self.atom_hash, block_atoms
 
+    @classmethod
+    def to_atom_batch(cls, blocks: Iterable["Block"]) -> List[Tuple[bytes, List[Atom]]]:
+        """Encode several blocks, sharing detail atoms whose payloads repeat.
+
+        Details are standalone atoms, so equal payloads across a segment (chain
+        id, validator key, difficulty, ...) have equal ids and are hashed once.
+        """
+        detail_atoms: Dict[bytes, Atom] = {}
+        return [blk.to_atom(detail_atoms=detail_atoms) for blk in blocks]
+
     @classmethod
     def from_atom(cls, node: Any, block_id: bytes) -> "Block":
 
+        block_id = bytes(block_id)
+        # each call returns a fresh Block; only the immutable decoded fields are
+        # shared, and only with later loads through the same node's storage
+        cache = getattr(node, "block_fields_cache", None)
+        if cache is not None:
+            cached = cache.get(block_id)
+            if cached is not None:
+                return cls(previous_block=None, **cached)
+
         block_header = node.get_atom_list_from_storage(block_id)
         if block_header is None or len(block_header) != 3:
             raise ValueError("malformed block atom chain")
@@ -202,15 +321,18 @@ class Block:
         if body_list_atom.next_id != ZERO32:
             raise ValueError("malformed block (body list tail)")
 
-        detail_atoms = node.get_atom_list_from_storage(body_list_atom.data)
-        if detail_atoms is None:
-            raise ValueError("missing block body list nodes")
-
-        if len(detail_atoms) != 11:
+        body_data = body_list_atom.data
+        if len(body_data) != 11 * len(ZERO32):
             raise ValueError("block body must contain exactly 11 detail entries")
 
+        detail_ids = [
+            body_data[offset : offset + len(ZERO32)]
+            for offset in range(0, len(body_data), len(ZERO32))
+        ]
         detail_values: List[bytes] = []
-        for detail_atom in detail_atoms:
+        for detail_atom in node.storage_get_many(detail_ids):
+            if detail_atom is None:
+                raise ValueError("missing block body detail atom")
             if detail_atom.kind is not AtomKind.BYTES:
                 raise ValueError("block body detail atoms must be bytes")
             detail_values.append(detail_atom.data)
@@ -229,10 +351,9 @@ class Block:
             nonce_bytes,
         ) = detail_values
 
-        return cls(
-            chain_id=_be_bytes_to_int(chain_bytes),
-            previous_block_hash=prev_bytes or ZERO32,
-            previous_block=None,
+        fields: Dict[str, Any] = dict(
+            chain_id=_be_bytes_to_int(chain_bytes),
+            previous_block_hash=prev_bytes or ZERO32,
             number=_be_bytes_to_int(number_bytes),
             timestamp=_be_bytes_to_int(timestamp_bytes),
             accounts_hash=accounts_bytes or None,
@@ -242,12 +363,22 @@ class Block:
             delay_difficulty=_be_bytes_to_int(delay_diff_bytes),
             validator_public_key=validator_bytes or None,
             nonce=_be_bytes_to_int(nonce_bytes),
-            signature=sig_atom.data if sig_atom is not None else None,
+            signature=sig_atom.data,
             atom_hash=block_id,
             body_hash=body_list_atom.object_id(),
         )
+        if cache is not None:
+            if len(cache) >= DECODED_BLOCKS_LIMIT:
+                cache.clear()
+            cache[block_id] = fields
+        return cls(previous_block=None, **fields)
 
-    def validate(self, storage_get: Callable[[bytes], Optional[Atom]]) -> bool:
+    def validate(
+        self,
+        storage_get: Callable[[bytes], Optional[Atom]],
+        *,
+        public_keys: Optional[Dict[bytes, Ed25519PublicKey]] = None,
+    ) -> bool:
         """Validate this block against storage.
 
         Checks:
@@ -255,6 +386,10 @@ class Block:
           validator's public key.
         - Timestamp monotonicity: if previous block exists (not ZERO32), this
           block's timestamp must be >= previous.timestamp + 1.
+
+        ``public_keys`` is an optional cache of parsed validator keys shared
+        across calls so a run of blocks from the same validator decodes the
+        key once.
         """
         # Unverifiable if critical fields are missing
         if not self.body_hash:
@@ -266,12 +401,16 @@ class Block:
         if self.timestamp is None:
             return False
 
-        # 1) Signature check over body hash
-        try:
-            pub = Ed25519PublicKey.from_public_bytes(bytes(self.validator_public_key))
-            pub.verify(self.signature, self.body_hash)
-        except InvalidSignature as e:
-            raise ValueError("invalid signature") from e
+        # 1) Signature check over body hash, skipped for triples already verified
+        validator_key = bytes(self.validator_public_key)
+        signature_key = (validator_key, bytes(self.signature), bytes(self.body_hash))
+        if not _signature_verified(signature_key):
+            try:
+                pub = _load_public_key(validator_key, public_keys)
+                pub.verify(self.signature, self.body_hash)
+            except InvalidSignature as e:
+                raise ValueError("invalid signature") from e
+            _remember_signature(signature_key)
 
         # 2) Timestamp monotonicity against previous block
         prev_ts: Optional[int] = None
@@ -298,6 +437,23 @@ class Block:
 
         return True
 
+    @classmethod
+    def validate_batch(
+        cls,
+        blocks: Iterable["Block"],
+        storage_get: Callable[[bytes], Optional[Atom]],
+    ) -> bool:
+        """Validate a sequence of blocks, sharing parsed validator keys.
+
+        Returns False as soon as a block is unverifiable and raises ValueError
+        for the first invalid block, mirroring ``validate``.
+        """
+        public_keys: Dict[bytes, Ed25519PublicKey] = {}
+        for blk in blocks:
+            if not blk.validate(storage_get, public_keys=public_keys):
+                return False
+        return True
+
     @staticmethod
     def _leading_zero_bits(buf: bytes) -> int:
         """Return the number of leading zero bits in the provided buffer."""
@@ -354,11 +510,34 @@ class Block:
         target = max(1, int(difficulty))
         start = int(self.nonce or 0)
         nonce = start
+
+        # Everything except the trailing nonce detail is fixed during the search,
+        # so hash that prefix of the body list once and resume from a copy.
+        fixed_body = b"".join(
+            self._detail_id(payload) for payload in self._detail_payloads()[:-1]
+        )
+        body_prefix = blake3(fixed_body)
+        body_size = len(fixed_body) + 32
+        signature = self._signature_payload()
+        signature_hash = hash_bytes(signature)
+        signature_size = len(signature)
+        # at least ``target`` leading zero bits <=> hash < 2**(256 - target)
+        limit = 1 << (256 - target) if target <= 256 else 0
         while True:
-            self.nonce = nonce
-            block_hash, _ = self.to_atom()
-            leading_zeros = self._leading_zero_bits(block_hash)
-            if leading_zeros >= target:
+            body_hasher = body_prefix.copy()
+            body_hasher.update(self._detail_id(_int_to_be_bytes(nonce)))
+            body_hash = object_id_from_parts(
+                AtomKind.LIST, body_hasher.digest(), ZERO32, body_size
+            )
+            sig_id = object_id_from_parts(
+                AtomKind.BYTES, signature_hash, body_hash, signature_size
+            )
+            block_hash = object_id_from_parts(
+                AtomKind.SYMBOL, _BLOCK_TYPE_HASH, sig_id, len(_BLOCK_TYPE)
+            )
+            if int.from_bytes(block_hash, "big") < limit:
+                self.nonce = nonce
+                self.body_hash = body_hash
                 self.atom_hash = block_hash
                 return nonce
             nonce += 1
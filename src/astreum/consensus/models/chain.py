@@ -1,5 +1,5 @@
 # chain.py
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from .block import Block
 from ...storage.models.atom import ZERO32, Atom
 
@@ -24,6 +24,8 @@ class Chain:
         # Atom and Block caches for this validation pass
         atom_cache: Dict[bytes, Optional[Atom]] = {}
         block_cache: Dict[bytes, Block] = {}
+        # Parsed validator keys shared across the walk
+        public_keys: Dict[bytes, Any] = {}
 
         def get_cached(k: bytes) -> Optional[Atom]:
             if k in atom_cache:
@@ -48,7 +50,7 @@ class Chain:
         while True:
             # Validate current block (signature over body, timestamp rule)
             try:
-                blk.validate(get_cached)  # may decode previous but uses cached atoms
+                blk.validate(get_cached, public_keys=public_keys)  # may decode previous but uses cached atoms
             except Exception:
                 # record first failure point then propagate
                 self.malicious_block_hash = getattr(blk, "atom_hash", None)
@@ -52,6 +52,8 @@ class Fork:
         # Caches to avoid double fetching/decoding
         atom_cache: Dict[bytes, Optional[Atom]] = {}
         block_cache: Dict[bytes, Block] = {}
+        # Parsed validator keys shared across the walk
+        public_keys: Dict[bytes, Any] = {}
 
         def get_cached(k: bytes) -> Optional[Atom]:
             if k in atom_cache:
@@ -77,7 +79,7 @@ class Fork:
         # Walk up to fork anchor, validating each block signature + timestamp
         while True:
             try:
-                blk.validate(get_cached)  # type: ignore[arg-type]
+                blk.validate(get_cached, public_keys=public_keys)  # type: ignore[arg-type]
             except Exception:
                 # mark the first failure point
                 self.malicious_block_hash = blk.atom_hash
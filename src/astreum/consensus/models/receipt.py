@@ -12,10 +12,8 @@ def _int_to_be_bytes(value: Optional[int]) -> bytes:
     if value is None:
         return b""
     value = int(value)
-    if value == 0:
-        return b"\x00"
-    size = (value.bit_length() + 7) // 8
-    return value.to_bytes(size, "big")
+    # zero has bit_length 0 and still encodes as a single byte
+    return value.to_bytes((value.bit_length() + 7) >> 3 or 1, "big")
 
 
 def _be_bytes_to_int(data: Optional[bytes]) -> int:
@@ -38,11 +36,22 @@ class Receipt:
         self.status = int(status)
         self.atom_hash = ZERO32
         self.atoms: List[Atom] = []
+        # field values the cached atom_hash/atoms were encoded from
+        self._encoded_fields: Optional[Tuple[bytes, int, int, bytes]] = None
 
     def to_atom(self) -> Tuple[bytes, List[Atom]]:
+        """Encode the receipt, reusing the previous encoding while fields are unchanged.
+
+        Receipts are encoded when applied and again when the block collects
+        them, so the second call is normally a cache hit.
+        """
         if self.status not in (STATUS_SUCCESS, STATUS_FAILED):
             raise ValueError("unsupported receipt status")
 
+        fields = (self.transaction_hash, self.status, self.cost, self.logs_hash)
+        if fields == self._encoded_fields:
+            return self.atom_hash, list(self.atoms)
+
         detail_specs = [
             (bytes(self.transaction_hash), AtomKind.LIST),
             (_int_to_be_bytes(self.status), AtomKind.BYTES),
@@ -62,7 +71,10 @@ class Receipt:
 
         atoms = detail_atoms + [type_atom]
         receipt_id = type_atom.object_id()
-        return receipt_id, atoms
+        self.atom_hash = receipt_id
+        self.atoms = atoms
+        self._encoded_fields = fields
+        return receipt_id, list(atoms)
 
     @classmethod
     def from_atom(cls, node: Any, receipt_id: bytes) -> Receipt:
@@ -183,15 +183,10 @@ def apply_transaction(node: Any, block: object, transaction_hash: bytes) -> int:
         recipient_account = Account.create()
 
     if transaction.recipient == TREASURY_ADDRESS:
-        stake_trie = recipient_account.data
-        existing_stake = stake_trie.get(node, transaction.sender)
-        current_stake = bytes_to_int(existing_stake)
-        new_stake = current_stake + transaction.amount
-        stake_trie.put(node, transaction.sender, int_to_bytes(new_stake))
-        recipient_account.data_hash = stake_trie.root_hash or ZERO32
-        recipient_account.balance += transaction.amount
-    else:
-        recipient_account.balance += transaction.amount
+        # stake deposits are summed per staker and written to the stake trie
+        # once per block when the accounts trie is updated
+        accounts.credit_data(TREASURY_ADDRESS, transaction.sender, transaction.amount)
+    recipient_account.balance += transaction.amount
 
     sender_account.balance -= tx_cost
     accounts.set_account(transaction.sender, sender_account)
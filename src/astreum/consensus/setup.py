@@ -4,6 +4,8 @@ import threading
 from queue import Queue
 from typing import Any, Optional
 
+from ..communication.util import PacketQueue
+
 from .validator import current_validator  # re-exported for compatibility
 from .workers import (
     make_discovery_worker,
@@ -44,7 +46,7 @@ def consensus_setup(node: Any, config: Optional[dict] = None) -> None:
 
     # Pending transactions queue (hash-only entries)
     node._validation_transaction_queue = getattr(
-        node, "_validation_transaction_queue", Queue()
+        node, "_validation_transaction_queue", PacketQueue()
     )
     # Single work queue of grouped items: (latest_block_hash, set(peer_ids))
     node._validation_verify_queue = getattr(
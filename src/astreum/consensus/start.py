@@ -1,3 +1,5 @@
+from typing import Optional
+
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
@@ -37,18 +39,12 @@ def process_blocks_and_transactions(self, validator_secret_key: Ed25519PrivateKe
             len(account_atoms),
         )
 
-        for atom in account_atoms + genesis_atoms:
-            try:
-                self._hot_storage_set(key=atom.object_id(), value=atom)
-            except Exception as exc:
-                self.logger.warning(
-                    "Unable to persist genesis atom %s: %s",
-                    atom.object_id(),
-                    exc,
-                )
+        self._hot_storage_set_many(account_atoms + genesis_atoms)
 
-        self.latest_block_hash = genesis_hash
-        self.latest_block = genesis_block
+        with self.latest_block_condition:
+            self.latest_block_hash = genesis_hash
+            self.latest_block = genesis_block
+            self.latest_block_condition.notify_all()
         self.logger.info("Genesis block stored with hash %s", genesis_hash.hex())
     else:
         self.logger.debug(
@@ -65,3 +61,17 @@ def process_blocks_and_transactions(self, validator_secret_key: Ed25519PrivateKe
     self.consensus_validation_thread.start()
 
     # ping all peers to announce validation capability
+
+
+def wait_for_new_block(self, initial_hash: Optional[bytes], timeout: Optional[float] = None) -> Optional[bytes]:
+    """Block until latest_block_hash differs from `initial_hash` and is set.
+
+    Returns the new hash, or None if `timeout` seconds pass first. The
+    validator notifies on every block, so waiters wake as soon as it lands.
+    """
+    with self.latest_block_condition:
+        changed = self.latest_block_condition.wait_for(
+            lambda: self.latest_block_hash is not None and self.latest_block_hash != initial_hash,
+            timeout,
+        )
+        return self.latest_block_hash if changed else None
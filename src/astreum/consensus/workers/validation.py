@@ -226,9 +226,18 @@ def make_validation_worker(
 
             # atomize block
             new_block_hash, new_block_atoms = new_block.to_atom()
-            # put as own latest block hash
-            node.latest_block_hash = new_block_hash
-            node.latest_block = new_block
+
+            # upload block, receipt and account atoms before announcing the
+            # block, so waiters and pinged peers can load it right away
+            node._hot_storage_set_many(new_block_atoms)
+            node._hot_storage_set_many(receipt_atoms)
+            node._hot_storage_set_many(account_atoms)
+
+            # put as own latest block hash and wake anyone waiting on it
+            with node.latest_block_condition:
+                node.latest_block_hash = new_block_hash
+                node.latest_block = new_block
+                node.latest_block_condition.notify_all()
             node.logger.info(
                 "Validated block #%s with hash %s (%d atoms)",
                 new_block.number,
@@ -273,7 +282,7 @@ def make_validation_worker(
                             ping_msg = Message(
                                 topic=MessageTopic.PING,
                                 content=ping_payload,
-                                sender=node.relay_public_key,
+                                sender_bytes=node.relay_public_key_bytes,
                             )
                             ping_msg.encrypt(peer.shared_key_bytes)
                             node.outgoing_queue.put((ping_msg.to_bytes(), address))
@@ -287,21 +296,6 @@ def make_validation_worker(
                         except Exception:
                             node.logger.exception("Failed queueing validator ping to %s", address)
 
-            # upload block atoms
-            for block_atom in new_block_atoms:
-                atom_id = block_atom.object_id()
-                node._hot_storage_set(key=atom_id, value=block_atom)
-
-            # upload receipt atoms
-            for receipt_atom in receipt_atoms:
-                atom_id = receipt_atom.object_id()
-                node._hot_storage_set(key=atom_id, value=receipt_atom)
-
-            # upload account atoms
-            for account_atom in account_atoms:
-                atom_id = account_atom.object_id()
-                node._hot_storage_set(key=atom_id, value=account_atom)
-
         node.logger.info("Validation worker stopped")
 
     return _validation_worker
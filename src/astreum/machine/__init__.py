@@ -2,7 +2,7 @@ from .models.expression import Expr
 from .models.environment import Env
 from .evaluations.low_evaluation import low_eval
 from .models.meter import Meter
-from .parser import parse, ParseError
+from .parser import parse, parse_source, ParseError
 from .tokenizer import tokenize
 from .evaluations.high_evaluation import high_eval
 from .evaluations.script_evaluation import script_eval
@@ -13,6 +13,7 @@ __all__ = [
     "low_eval",
     "Meter",
     "parse",
+    "parse_source",
     "tokenize",
     "high_eval",
     "ParseError",
@@ -1,4 +1,5 @@
-from typing import List, Optional, Union
+from itertools import islice
+from typing import Any, List, Optional, Tuple, Union
 import uuid
 
 from ..models.environment import Env
@@ -37,201 +38,239 @@ def _expr_to_bytes(expr: Expr) -> Optional[bytes]:
     return None
 
 
+def _coerce_bytes(v: Expr) -> Union[bytes, Expr]:
+    """Turn an Expr into a contiguous bytes buffer, or return an error expr."""
+    if isinstance(v, Expr.Bytes):
+        return v.value
+    if isinstance(v, Expr.ListExpr):
+        # expect a list of Expr.Bytes
+        elements = v.elements
+        for el in elements:
+            if not isinstance(el, Expr.Bytes):
+                return error_expr("eval", "byte list must contain only Bytes elements")
+        return b"".join([el.value for el in elements])
+    if _is_error(v):
+        return v
+    return error_expr("eval", "argument must resolve to Bytes or (Bytes ...)")
+
+
+# kinds of lowered sk body tokens
+_SK_LITERAL = 0  # bytes pushed as-is
+_SK_ARG = 1      # $n placeholder, replaced by the n-th argument
+_SK_EVAL = 2     # nested list, evaluated and coerced to bytes on each call
+_SK_ERROR = 3    # malformed token; payload is the error message
+
+
+def _lower_sk_body(body_expr: Expr.ListExpr) -> List[Tuple[int, Any]]:
+    """Classify each sk body token once; the result is cached on the body.
+
+    Calls then only substitute arguments and evaluate nested lists, instead
+    of re-dispatching on every token's type and re-parsing placeholders.
+    """
+    lowered = body_expr._sk_body
+    if lowered is not None:
+        return lowered
+    lowered = []
+    for tok in body_expr.elements:
+        if isinstance(tok, Expr.Symbol):
+            name = tok.value
+            if name.startswith("$"):
+                idx_s = name[1:]
+                if not idx_s.isdigit():
+                    lowered.append((_SK_ERROR, "invalid sk placeholder"))
+                else:
+                    lowered.append((_SK_ARG, int(idx_s)))  # $0 is first
+            else:
+                lowered.append((_SK_LITERAL, tok.encoded))
+        elif isinstance(tok, Expr.Bytes):
+            lowered.append((_SK_LITERAL, tok.value))
+        elif isinstance(tok, Expr.ListExpr):
+            lowered.append((_SK_EVAL, tok))
+        else:
+            lowered.append((_SK_ERROR, "invalid token in sk body"))
+    body_expr._sk_body = lowered
+    return lowered
+
+
+def _fn_params(params_expr: Expr.ListExpr) -> Optional[List[str]]:
+    """Return the parameter names of a fn form (cached), or None if one is not a symbol."""
+    params = params_expr._fn_params
+    if params is None:
+        for p in params_expr.elements:
+            if not isinstance(p, Expr.Symbol):
+                return None
+        params = params_expr._fn_params = [p.value for p in params_expr.elements]
+    return params
+
+
 def high_eval(self, expr: Expr, env_id: Optional[uuid.UUID] = None, meter = None) -> Expr:
-    """Evaluate high-level expressions with scoped environments and metering."""
+    """Evaluate high-level expressions with scoped environments and metering.
+
+    Forms in tail position (a single-element list, a fn body) are evaluated by
+    looping rather than recursing, so a chain of calls costs one Python frame;
+    the environments they open are released together when the loop returns.
+    """
     if meter is None:
         meter = Meter()
 
-    call_env_id = uuid.uuid4()
-    self.environments[call_env_id] = Env(parent_id=env_id)
-    env_id = call_env_id
-
+    opened_envs: List[uuid.UUID] = []
     try:
-        # ---------- atoms ----------
-        if _is_error(expr):
-            return expr
-
-        if isinstance(expr, Expr.Symbol):
-            bound = self.env_get(env_id, expr.value)
-            if bound is None:
-                return error_expr("eval", f"unbound symbol '{expr.value}'")
-            return bound
-
-        if not isinstance(expr, Expr.ListExpr):
-            return expr  # Expr.Bytes or other literals passthrough
-
-        # ---------- empty / single ----------
-        if len(expr.elements) == 0:
-            return expr
-        if len(expr.elements) == 1:
-            return self.high_eval(expr=expr.elements[0], env_id=env_id, meter=meter)
-
-        tail = expr.elements[-1]
-
-        # ---------- (value name def) ----------
-        if isinstance(tail, Expr.Symbol) and tail.value == "def":
-            if len(expr.elements) < 3:
-                return error_expr("eval", "def expects (value name def)")
-            name_e = expr.elements[-2]
-            if not isinstance(name_e, Expr.Symbol):
-                return error_expr("eval", "def name must be symbol")
-            value_e = expr.elements[-3]
-            value_res = self.high_eval(expr=value_e, env_id=env_id, meter=meter)
-            if _is_error(value_res):
+        while True:
+            # ---------- atoms ----------
+            # atoms never bind names, so they resolve against the caller's env
+            # without allocating a call env of their own
+            if _is_error(expr):
+                return expr
+
+            if isinstance(expr, Expr.Symbol):
+                bound = self.env_get(env_id, expr.value)
+                if bound is None:
+                    return error_expr("eval", f"unbound symbol '{expr.value}'")
+                return bound
+
+            if not isinstance(expr, Expr.ListExpr):
+                return expr  # Expr.Bytes or other literals passthrough
+
+            call_env_id = uuid.uuid4()
+            self.environments[call_env_id] = Env(parent_id=env_id)
+            opened_envs.append(call_env_id)
+            env_id = call_env_id
+
+            # ---------- empty / single ----------
+            if len(expr.elements) == 0:
+                return expr
+            if len(expr.elements) == 1:
+                expr = expr.elements[0]
+                continue
+
+            tail = expr.elements[-1]
+
+            # ---------- (value name def) ----------
+            if isinstance(tail, Expr.Symbol) and tail.value == "def":
+                if len(expr.elements) < 3:
+                    return error_expr("eval", "def expects (value name def)")
+                name_e = expr.elements[-2]
+                if not isinstance(name_e, Expr.Symbol):
+                    return error_expr("eval", "def name must be symbol")
+                value_e = expr.elements[-3]
+                value_res = self.high_eval(expr=value_e, env_id=env_id, meter=meter)
+                if _is_error(value_res):
+                    return value_res
+                self.env_set(call_env_id, name_e.value, value_res)
                 return value_res
-            self.env_set(call_env_id, name_e.value, value_res)
-            return value_res
-        
-        # Reference Call
-        # (atom_id ref)
-        if isinstance(tail, Expr.Symbol) and tail.value == "ref":
-            if len(expr.elements) != 2:
-                return error_expr("eval", "ref expects (atom_id ref)")
-            key_bytes = _expr_to_bytes(expr.elements[0])
-            if not key_bytes:
-                return error_expr("eval", "ref expects (atom_id ref)")
-            stored_list = self.get_expr_list_from_storage(key_bytes)
-            if stored_list is None:
-                return error_expr("eval", "ref target not found")
-            return stored_list
-
-        # Low Level Call
-        # (arg1 arg2 ... ((body) sk))
-        if isinstance(tail, Expr.ListExpr):
-            inner = tail.elements
-            if len(inner) >= 2 and isinstance(inner[-1], Expr.Symbol) and inner[-1].value == "sk":
-                body_expr = inner[-2]
-                if not isinstance(body_expr, Expr.ListExpr):
-                    return error_expr("eval", "sk body must be list")
-
-                # helper: turn an Expr into a contiguous bytes buffer
-                def to_bytes(v: Expr) -> Union[bytes, Expr]:
-                    if isinstance(v, Expr.Bytes):
-                        return v.value
-                    if isinstance(v, Expr.ListExpr):
-                        # expect a list of Expr.Bytes
-                        out: bytearray = bytearray()
-                        for el in v.elements:
-                            if isinstance(el, Expr.Bytes):
-                                out.extend(el.value)
-                            else:
-                                return error_expr("eval", "byte list must contain only Bytes elements")
-                        return bytes(out)
-                    if _is_error(v):
-                        return v
-                    return error_expr("eval", "argument must resolve to Bytes or (Bytes ...)")
-
-                # resolve ALL preceding args into bytes (can be Bytes or List[Bytes])
-                args_exprs = expr.elements[:-1]
-                arg_bytes: List[bytes] = []
-                for a in args_exprs:
-                    v = self.high_eval(expr=a, env_id=env_id, meter=meter)
-                    if _is_error(v):
-                        return v
-                    vb = to_bytes(v)
-                    if not isinstance(vb, bytes):
-                        if _is_error(vb):
-                            return vb
-                        return error_expr("eval", "unexpected expression while coercing to bytes")
-                    arg_bytes.append(vb)
-
-                # build low-level code with $0-based placeholders ($0 = first arg)
-                code: List[bytes] = []
-
-                def emit(tok: Expr) -> Union[None, Expr]:
-                    if isinstance(tok, Expr.Symbol):
-                        name = tok.value
-                        if name.startswith("$"):
-                            idx_s = name[1:]
-                            if not idx_s.isdigit():
-                                return error_expr("eval", "invalid sk placeholder")
-                            idx = int(idx_s)  # $0 is first
-                            if idx < 0 or idx >= len(arg_bytes):
+
+            # Reference Call
+            # (atom_id ref)
+            if isinstance(tail, Expr.Symbol) and tail.value == "ref":
+                if len(expr.elements) != 2:
+                    return error_expr("eval", "ref expects (atom_id ref)")
+                key_bytes = _expr_to_bytes(expr.elements[0])
+                if not key_bytes:
+                    return error_expr("eval", "ref expects (atom_id ref)")
+                stored_list = self.get_expr_list_from_storage(key_bytes)
+                if stored_list is None:
+                    return error_expr("eval", "ref target not found")
+                return stored_list
+
+            # Low Level Call
+            # (arg1 arg2 ... ((body) sk))
+            if isinstance(tail, Expr.ListExpr):
+                inner = tail.elements
+                if len(inner) >= 2 and isinstance(inner[-1], Expr.Symbol) and inner[-1].value == "sk":
+                    body_expr = inner[-2]
+                    if not isinstance(body_expr, Expr.ListExpr):
+                        return error_expr("eval", "sk body must be list")
+
+                    # resolve ALL preceding args into bytes (can be Bytes or List[Bytes])
+                    # islice walks the args in place instead of copying elements[:-1]
+                    arg_bytes: List[bytes] = []
+                    for a in islice(expr.elements, len(expr.elements) - 1):
+                        v = self.high_eval(expr=a, env_id=env_id, meter=meter)
+                        if _is_error(v):
+                            return v
+                        vb = _coerce_bytes(v)
+                        if not isinstance(vb, bytes):
+                            if _is_error(vb):
+                                return vb
+                            return error_expr("eval", "unexpected expression while coercing to bytes")
+                        arg_bytes.append(vb)
+
+                    # build low-level code with $0-based placeholders ($0 = first arg)
+                    code: List[bytes] = []
+                    for kind, payload in _lower_sk_body(body_expr):
+                        if kind == _SK_LITERAL:
+                            code.append(payload)
+                        elif kind == _SK_ARG:
+                            if payload >= len(arg_bytes):
                                 return error_expr("eval", "arity mismatch in sk placeholder")
-                            code.append(arg_bytes[idx])
-                            return None
-                        code.append(name.encode())
-                        return None
-
-                    if isinstance(tok, Expr.Bytes):
-                        code.append(tok.value)
-                        return None
-
-                    if isinstance(tok, Expr.ListExpr):
-                        rv = self.high_eval(expr=tok, env_id=env_id, meter=meter)
-                        if _is_error(rv):
-                            return rv
-                        rb = to_bytes(rv)
-                        if not isinstance(rb, bytes):
-                            if _is_error(rb):
-                                return rb
-                            return error_expr("eval", "unexpected expression while coercing list token to bytes")
-                        code.append(rb)
-                        return None
-
-                    if _is_error(tok):
-                        return tok
-
-                    return error_expr("eval", "invalid token in sk body")
-
-                for t in body_expr.elements:
-                    err = emit(t)
-                    if err is not None and _is_error(err):
-                        return err
-
-                # Execute low-level code built from sk-body using the caller's meter
-                res = self.low_eval(code, meter=meter)
-                return res
-
-        # High Level Call
-        # (arg1 arg2 ... ((body) (params) fn))
-        if isinstance(tail, Expr.ListExpr):
-            fn_form = tail
-            if (len(fn_form.elements) >= 3
-                and isinstance(fn_form.elements[-1], Expr.Symbol)
-                and fn_form.elements[-1].value == "fn"):
-
-                body_expr   = fn_form.elements[-3]
-                params_expr = fn_form.elements[-2]
-
-                if not isinstance(body_expr, Expr.ListExpr):
-                    return error_expr("eval", "fn body must be list")
-                if not isinstance(params_expr, Expr.ListExpr):
-                    return error_expr("eval", "fn params must be list")
-
-                params: List[str] = []
-                for p in params_expr.elements:
-                    if not isinstance(p, Expr.Symbol):
+                            code.append(arg_bytes[payload])
+                        elif kind == _SK_EVAL:
+                            rv = self.high_eval(expr=payload, env_id=env_id, meter=meter)
+                            if _is_error(rv):
+                                return rv
+                            rb = _coerce_bytes(rv)
+                            if not isinstance(rb, bytes):
+                                if _is_error(rb):
+                                    return rb
+                                return error_expr("eval", "unexpected expression while coercing list token to bytes")
+                            code.append(rb)
+                        else:
+                            return error_expr("eval", payload)
+
+                    # Execute low-level code built from sk-body using the caller's meter
+                    res = self.low_eval(code, meter=meter)
+                    return res
+
+            # High Level Call
+            # (arg1 arg2 ... ((body) (params) fn))
+            if isinstance(tail, Expr.ListExpr):
+                fn_form = tail
+                if (len(fn_form.elements) >= 3
+                    and isinstance(fn_form.elements[-1], Expr.Symbol)
+                    and fn_form.elements[-1].value == "fn"):
+
+                    body_expr   = fn_form.elements[-3]
+                    params_expr = fn_form.elements[-2]
+
+                    if not isinstance(body_expr, Expr.ListExpr):
+                        return error_expr("eval", "fn body must be list")
+                    if not isinstance(params_expr, Expr.ListExpr):
+                        return error_expr("eval", "fn params must be list")
+
+                    params = _fn_params(params_expr)
+                    if params is None:
                         return error_expr("eval", "fn param must be symbol")
-                    params.append(p.value)
-
-                args_exprs = expr.elements[:-1]
-                if len(args_exprs) != len(params):
-                    return error_expr("eval", "arity mismatch")
-
-                arg_bytes: List[bytes] = []
-                for a in args_exprs:
-                    v = self.high_eval(expr=a, env_id=env_id, meter=meter)
-                    if _is_error(v):
-                        return v
-                    if not isinstance(v, Expr.Bytes):
-                        return error_expr("eval", "argument must resolve to Bytes")
-                    arg_bytes.append(v.value)
-
-                # child env, bind params -> Expr.Bytes
-                child_env = uuid.uuid4()
-                self.environments[child_env] = Env(parent_id=env_id)
-                try:
+
+                    arg_count = len(expr.elements) - 1
+                    if arg_count != len(params):
+                        return error_expr("eval", "arity mismatch")
+
+                    arg_bytes: List[bytes] = []
+                    for a in islice(expr.elements, arg_count):
+                        v = self.high_eval(expr=a, env_id=env_id, meter=meter)
+                        if _is_error(v):
+                            return v
+                        if not isinstance(v, Expr.Bytes):
+                            return error_expr("eval", "argument must resolve to Bytes")
+                        arg_bytes.append(v.value)
+
+                    # child env, bind params -> Expr.Bytes
+                    child_env = uuid.uuid4()
+                    self.environments[child_env] = Env(parent_id=env_id)
+                    opened_envs.append(child_env)
                     for name_b, val_b in zip(params, arg_bytes):
                         self.env_set(child_env, name_b, Expr.Bytes(val_b))
 
                     # evaluate HL body, metered from the top
-                    return self.high_eval(expr=body_expr, env_id=child_env, meter=meter)
-                finally:
-                    self.environments.pop(child_env, None)
+                    expr = body_expr
+                    env_id = child_env
+                    continue
 
-        # ---------- default: resolve each element and return list ----------
-        resolved: List[Expr] = [self.high_eval(expr=e, env_id=env_id, meter=meter) for e in expr.elements]
-        return Expr.ListExpr(resolved)
+            # ---------- default: resolve each element and return list ----------
+            resolved: List[Expr] = [self.high_eval(expr=e, env_id=env_id, meter=meter) for e in expr.elements]
+            return Expr.ListExpr(resolved)
     finally:
-        self.environments.pop(call_env_id, None)
+        # innermost first, as the nested calls this loop replaces would have
+        environments = self.environments
+        for opened in reversed(opened_envs):
+            environments.pop(opened, None)
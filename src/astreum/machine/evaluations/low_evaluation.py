@@ -1,3 +1,4 @@
+import math
 from typing import Dict, List, Union
 
 from astreum.storage.models.atom import ZERO32, Atom, AtomKind
@@ -18,15 +19,11 @@ def int_to_tc(n: int, width_bytes: int) -> bytes:
 
 def min_tc_width(n: int) -> int:
     """minimum bytes to store n in two's complement."""
-    if n == 0:
-        return 1
-    w = 1
-    while True:
-        try:
-            n.to_bytes(w, "big", signed=True)
-            return w
-        except OverflowError:
-            w += 1
+    # magnitude bits plus one sign bit, rounded up to whole bytes
+    return ((n if n >= 0 else ~n).bit_length() + 8) >> 3
+
+# every one-byte value, so one-byte results are a list index rather than an allocation
+_BYTE_VALUES = [bytes((i,)) for i in range(256)]
 
 def nand_bytes(a: bytes, b: bytes) -> bytes:
     """Bitwise NAND (NOT-AND) on two byte strings, zero-extending to max width.
@@ -39,6 +36,8 @@ def nand_bytes(a: bytes, b: bytes) -> bytes:
         1 | 0 |  1
         1 | 1 |  0
     """
+    if len(a) == 1 and len(b) == 1:
+        return _BYTE_VALUES[~(a[0] & b[0]) & 0xFF]
     w = max(len(a), len(b), 1)
     au = int.from_bytes(a.rjust(w, b"\x00"), "big", signed=False)
     bu = int.from_bytes(b.rjust(w, b"\x00"), "big", signed=False)
@@ -46,15 +45,76 @@ def nand_bytes(a: bytes, b: bytes) -> bytes:
     resu = (~(au & bu)) & mask
     return resu.to_bytes(w, "big", signed=False)
 
+# every token low_eval treats as an instruction; anything else is a literal
+_OPCODES = frozenset((
+    b"nand",
+    b"jump",
+    b"heap_get",
+    b"heap_set",
+    b"atom_slice",
+    b"atom_link",
+    b"atom_concat",
+    b"atom_new",
+    b"atom_load",
+))
+
+# opcodes that read or write atom storage; programs using them are not memoised
+_STORAGE_OPCODES = frozenset((
+    b"atom_slice",
+    b"atom_link",
+    b"atom_concat",
+    b"atom_new",
+    b"atom_load",
+))
+
+LOW_EVAL_CACHE_LIMIT = 4096
+
 def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
+    """Execute low-level bytecode, reusing the result of a repeated storage-free program.
+
+    Without atom opcodes a program is a pure function of its tokens (its heap
+    is local), so its result and meter cost are kept per code tuple. A hit
+    charges the recorded cost in one go, which succeeds exactly when each of
+    the original charges would have; otherwise the program runs again and
+    fails at the same step it would have.
+    """
+    cache = getattr(self, "low_eval_cache", None)
+    if cache is None or not meter.enabled or not _STORAGE_OPCODES.isdisjoint(code):
+        return _low_eval(self, code, meter)
+
+    key = tuple(code)
+    cached = cache.get(key)
+    if cached is not None:
+        value, cost = cached
+        if meter.charge_bytes(cost):
+            return Expr.Bytes(value)
+        return _low_eval(self, code, meter)
+
+    used = meter.used
+    result = _low_eval(self, code, meter)
+    if isinstance(result, Expr.Bytes):
+        if len(cache) >= LOW_EVAL_CACHE_LIMIT:
+            cache.clear()
+        cache[key] = (result.value, meter.used - used)
+    return result
+
+def _low_eval(self, code: List[bytes], meter: Meter) -> Expr:
         """Execute low-level bytecode with stack/heap semantics under metering."""
         heap: Dict[bytes, bytes] = {}
 
         stack: List[bytes] = []
         pc = 0
+        code_len = len(code)
+
+        # charges are an add, a compare and a store on meter.used, with the
+        # same acceptance rule as Meter.charge_bytes but no call per opcode;
+        # a disabled meter never fails or counts, so a scratch one is charged
+        if not meter.enabled:
+            meter = Meter()
+        limit = math.inf if meter.limit is None else meter.limit
 
         while True:
-            if pc >= len(code):
+            if pc >= code_len:
                 if len(stack) != 1:
                     return error_expr("low_eval", "bad stack")
                 # wrap successful result as an Expr.Bytes
@@ -63,6 +123,12 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
             tok = code[pc]
             pc += 1
 
+            # literals are most of a program; one set probe pushes them
+            # instead of a comparison against every opcode below
+            if tok not in _OPCODES:
+                stack.append(tok)
+                continue
+
             # ---------- ADD ----------
             # if tok == b"add":
             #     if len(stack) < 2:
@@ -89,8 +155,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                 a_b = stack.pop()
                 res_b = nand_bytes(a_b, b_b)
                 # bitwise cost: 2 * max(len(a), len(b))
-                if not meter.charge_bytes(2 * max(len(a_b), len(b_b), 1)):
+                used = meter.used + 2 * max(len(a_b), len(b_b), 1)
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
                 stack.append(res_b)
                 continue
 
@@ -99,10 +167,12 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                 if len(stack) < 1:
                     return error_expr("low_eval", "underflow")
                 tgt_b = stack.pop()
-                if not meter.charge_bytes(1):
+                used = meter.used + 1
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
                 tgt_i = tc_to_int(tgt_b)
-                if tgt_i < 0 or tgt_i >= len(code):
+                if tgt_i < 0 or tgt_i >= code_len:
                     return error_expr("low_eval", "bad jump")
                 pc = tgt_i
                 continue
@@ -114,8 +184,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                 key = stack.pop()
                 val = heap.get(key) or b""
                 # get cost: 1
-                if not meter.charge_bytes(1):
+                used = meter.used + 1
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
                 stack.append(val)
                 continue
 
@@ -125,8 +197,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                     return error_expr("low_eval", "underflow")
                 val = stack.pop()
                 key = stack.pop()
-                if not meter.charge_bytes(len(val)):
+                used = meter.used + len(val)
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
                 heap[key] = val
                 continue
 
@@ -150,8 +224,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                 data = atom.data
                 slice_bytes = data[idx : idx + length]
 
-                if not meter.charge_bytes(len(slice_bytes)):
+                used = meter.used + len(slice_bytes)
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
 
                 new_atom = Atom(data=slice_bytes, kind=atom.kind)
                 new_id = new_atom.object_id()
@@ -170,8 +246,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                 id2_b = stack.pop()
                 id1_b = stack.pop()
 
-                if not meter.charge_bytes(len(id1_b) + len(id2_b)):
+                used = meter.used + len(id1_b) + len(id2_b)
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
                 
                 atom = self.storage_get(key=id_b)
                 if atom is None:
@@ -202,8 +280,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
 
                 joined = atom1.data + atom2.data
 
-                if not meter.charge_bytes(len(joined)):
+                used = meter.used + len(joined)
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
 
                 new_atom = Atom(data=joined, kind=AtomKind.BYTES)
                 new_id = new_atom.object_id()
@@ -233,8 +313,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                 except ValueError:
                     return error_expr("low_eval", "unknown atom kind")
 
-                if not meter.charge_bytes(len(data_b)):
+                used = meter.used + len(data_b)
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
 
                 new_atom = Atom(data=data_b, kind=kind)
                 new_id = new_atom.object_id()
@@ -270,8 +352,10 @@ def low_eval(self, code: List[bytes], meter: Meter) -> Expr:
                 data = atom.data
                 chunk = data[idx : idx + length]
 
-                if not meter.charge_bytes(len(chunk)):
+                used = meter.used + len(chunk)
+                if used >= limit:
                     return error_expr("low_eval", "meter limit")
+                meter.used = used
 
                 stack.append(chunk)
                 continue
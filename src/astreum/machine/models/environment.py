@@ -1,5 +1,5 @@
 from ast import Expr
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import uuid
 
 
@@ -11,14 +11,41 @@ class Env:
     ):
         self.data: Dict[str, Expr] = {} if data is None else data
         self.parent_id = parent_id
+        # data dicts of this env and its ancestors, resolved on first lookup
+        self.chain: Optional[Tuple[Dict[str, Expr], ...]] = None
+
+def _env_chain(self, env: Env) -> Tuple[Dict[str, Expr], ...]:
+    """Return env's data dict followed by its ancestors', caching complete chains."""
+    if env.chain is not None:
+        return env.chain
+    frames = [env.data]
+    parent_id = env.parent_id
+    complete = True
+    while parent_id:
+        parent = self.environments.get(parent_id)
+        if parent is None:
+            complete = False
+            break
+        if parent.chain is not None:
+            frames.extend(parent.chain)
+            break
+        frames.append(parent.data)
+        parent_id = parent.parent_id
+    chain = tuple(frames)
+    # parents are fixed at creation and bindings mutate the dicts in place,
+    # so a chain that reached the root stays valid for the env's lifetime
+    if complete:
+        env.chain = chain
+    return chain
 
 def env_get(self, env_id: uuid.UUID, key: str) -> Optional[Expr]:
     """Resolve a value by walking the environment chain starting at env_id."""
     cur = self.environments.get(env_id)
-    while cur is not None:
-        if key in cur.data:
-            return cur.data[key]
-        cur = self.environments.get(cur.parent_id) if cur.parent_id else None
+    if cur is None:
+        return None
+    for frame in _env_chain(self, cur):
+        if key in frame:
+            return frame[key]
     return None
 
 def env_set(self, env_id: uuid.UUID, key: str, value: Expr) -> bool:
@@ -1,15 +1,22 @@
+from functools import lru_cache
 from typing import Any, List, Optional, Tuple
 
-from ...storage.models.atom import Atom, AtomKind
+from ...storage.models.atom import Atom, AtomKind, ZERO32
 
-ZERO32 = b"\x00" * 32
 ERROR_SYMBOL = "error"
 
 
 class Expr:
+    # the variants are allocated per token and per evaluation result, so they
+    # carry fixed slots (including the cached id) instead of an instance dict
     class ListExpr:
+        __slots__ = ("elements", "_sk_body", "_fn_params", "_cached_id")
+
         def __init__(self, elements: List['Expr']):
             self.elements = elements
+            # evaluator lowerings of this list, built on first use
+            self._sk_body: Optional[List[Tuple[int, Any]]] = None
+            self._fn_params: Optional[List[str]] = None
         
         def __repr__(self):
             if not self.elements:
@@ -21,8 +28,19 @@ class Expr:
             return Expr.to_atoms(self)
         
     class Symbol:
+        __slots__ = ("value", "_encoded", "_cached_id")
+
         def __init__(self, value: str):
             self.value = value
+            self._encoded: Optional[bytes] = None
+
+        @property
+        def encoded(self) -> bytes:
+            """UTF-8 bytes of the symbol name, encoded once per symbol."""
+            if self._encoded is None:
+                value = self.value
+                self._encoded = value if isinstance(value, bytes) else value.encode("utf-8")
+            return self._encoded
 
         def __repr__(self):
             return f"{self.value}"
@@ -31,6 +49,8 @@ class Expr:
             return Expr.to_atoms(self)
         
     class Bytes:
+        __slots__ = ("value", "_cached_id")
+
         def __init__(self, value: bytes):
             self.value = value
 
@@ -117,27 +137,31 @@ class Expr:
 
     @staticmethod
     def to_atoms(e: "Expr") -> Tuple[bytes, List[Atom]]:
-        def symbol(value: str) -> Tuple[bytes, List[Atom]]:
+        # every atom is appended once to a single output list; children are
+        # emitted before the list chain that references them
+        out: List[Atom] = []
+
+        def symbol(value: bytes) -> bytes:
             atom = Atom(
-                data=value.encode("utf-8"),
+                data=value,
                 kind=AtomKind.SYMBOL,
             )
-            return atom.object_id(), [atom]
+            out.append(atom)
+            return atom.object_id()
 
-        def bytes_value(data: bytes) -> Tuple[bytes, List[Atom]]:
+        def bytes_value(data: bytes) -> bytes:
             atom = Atom(
                 data=data,
                 kind=AtomKind.BYTES,
             )
-            return atom.object_id(), [atom]
-
-        def lst(items: List["Expr"]) -> Tuple[bytes, List[Atom]]:
-            acc: List[Atom] = []
-            child_hashes: List[bytes] = []
-            for it in items:
-                h, atoms = Expr.to_atoms(it)
-                acc.extend(atoms)
-                child_hashes.append(h)
+            out.append(atom)
+            return atom.object_id()
+
+        def lst(child_hashes: List[bytes]) -> bytes:
+            if not child_hashes:
+                empty_atom = Atom(data=b"", kind=AtomKind.LIST)
+                out.append(empty_atom)
+                return empty_atom.object_id()
             next_hash = ZERO32
             elem_atoms: List[Atom] = []
             for h in reversed(child_hashes):
@@ -145,21 +169,31 @@ class Expr:
                 next_hash = a.object_id()
                 elem_atoms.append(a)
             elem_atoms.reverse()
-            if elem_atoms:
-                head = elem_atoms[0].object_id()
+            out.extend(elem_atoms)
+            return next_hash
+
+        # post-order walk with an explicit stack so deeply nested lists neither
+        # pay a Python frame per level nor hit the recursion limit
+        results: List[bytes] = []
+        stack: List[Tuple["Expr", bool]] = [(e, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if isinstance(node, Expr.Symbol):
+                results.append(symbol(node.encoded))
+            elif isinstance(node, Expr.Bytes):
+                results.append(bytes_value(node.value))
+            elif isinstance(node, Expr.ListExpr):
+                if not expanded:
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in reversed(node.elements))
+                    continue
+                split = len(results) - len(node.elements)
+                child_hashes = results[split:]
+                del results[split:]
+                results.append(lst(child_hashes))
             else:
-                empty_atom = Atom(data=b"", kind=AtomKind.LIST)
-                elem_atoms = [empty_atom]
-                head = empty_atom.object_id()
-            return head, acc + elem_atoms
-
-        if isinstance(e, Expr.Symbol):
-            return symbol(e.value)
-        if isinstance(e, Expr.Bytes):
-            return bytes_value(e.value)
-        if isinstance(e, Expr.ListExpr):
-            return lst(e.elements)
-        raise TypeError("unknown Expr variant")
+                raise TypeError("unknown Expr variant")
+        return results[0], out
 
 def _expr_generate_id(expr) -> bytes:
     expr_id, _ = Expr.to_atoms(expr)
@@ -179,8 +213,18 @@ for _expr_cls in (Expr.ListExpr, Expr.Symbol, Expr.Bytes):
     _expr_cls.id = property(_expr_cached_id)  # type: ignore[attr-defined]
 
 
+# expressions are never mutated once built, so constant nodes can be shared;
+# sharing also shares their cached ids
+_ERROR_HEAD = Expr.Symbol(ERROR_SYMBOL)
+_REF_SYMBOL = Expr.Symbol("ref")
+
+
+@lru_cache(maxsize=256)
 def error_expr(topic: str, message: str) -> Expr.ListExpr:
-    """Encode an error as (error <topic-bytes> <message-bytes>)."""
+    """Encode an error as (error <topic-bytes> <message-bytes>).
+
+    Results are interned per (topic, message); callers must not mutate them.
+    """
     try:
         topic_bytes = topic.encode("utf-8")
     except UnicodeEncodeError as exc:
@@ -190,7 +234,7 @@ def error_expr(topic: str, message: str) -> Expr.ListExpr:
     except UnicodeEncodeError as exc:
         raise ValueError("error message must be valid utf-8") from exc
     return Expr.ListExpr([
-        Expr.Symbol(ERROR_SYMBOL),
+        _ERROR_HEAD,
         Expr.Bytes(topic_bytes),
         Expr.Bytes(message_bytes),
     ])
@@ -211,7 +255,7 @@ def get_expr_list_from_storage(self, key: bytes) -> Optional["ListExpr"]:
                 case AtomKind.LIST:
                     expr_list.append(Expr.ListExpr([
                         Expr.Bytes(atom.data),
-                        Expr.Symbol("ref")
+                        _REF_SYMBOL,
                     ]))
 
         expr_list.reverse()
@@ -1,51 +1,100 @@
-from typing import List, Tuple
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from . import Expr
+from .tokenizer import tokenize
 
 class ParseError(Exception):
     pass
 
+# the literal forms int() accepts from a whitespace-free token; matching first
+# keeps symbols off the int() -> ValueError path
+_INT_TOKEN = re.compile(r"[+-]?\d+(?:_\d+)*\Z").match
+
+# expressions are never mutated once built, so parse hands out one shared
+# node per symbol name and per one-byte integer; shared nodes also share
+# their encoded name and cached id, and interned names compare by identity
+SYMBOL_POOL_LIMIT = 4096
+_SYMBOL_POOL: Dict[str, Expr.Symbol] = {}
+_BYTES_POOL = [Expr.Bytes(bytes([i])) for i in range(256)]
+
+
+def _intern_symbol(name: str) -> Expr.Symbol:
+    symbol = _SYMBOL_POOL.get(name)
+    if symbol is None:
+        if len(_SYMBOL_POOL) >= SYMBOL_POOL_LIMIT:
+            _SYMBOL_POOL.clear()
+        symbol = _SYMBOL_POOL[name] = Expr.Symbol(sys.intern(name))
+    return symbol
+
+
+def _int_to_min_tc(v: int) -> bytes:
+    """Return the minimal-width signed two's complement big-endian
+    byte encoding of integer v. Width expands just enough so that
+    decoding with signed=True yields the same value and sign.
+    Example: 0 -> b"\x00", 127 -> b"\x7f", 128 -> b"\x00\x80".
+    """
+    # magnitude bits plus one sign bit, rounded up to whole bytes
+    width = ((v if v >= 0 else ~v).bit_length() + 8) >> 3
+    return v.to_bytes(width, "big", signed=True)
+
+
+def _parse_atom(tok: str) -> Expr:
+    # integer -> Bytes (variable-length two's complement)
+    if _INT_TOKEN(tok):
+        v = int(tok)
+        if -128 <= v < 128:
+            return _BYTES_POOL[v & 0xFF]
+        return Expr.Bytes(_int_to_min_tc(v))
+    return _intern_symbol(tok)
+
+
 def _parse_one(tokens: List[str], pos: int = 0) -> Tuple[Expr, int]:
-    if pos >= len(tokens):
-        raise ParseError("unexpected end")
-    tok = tokens[pos]
-
-    if tok == '(':  # list
-        items: List[Expr] = []
-        i = pos + 1
-        while i < len(tokens):
-            if tokens[i] == ')':
-                return Expr.ListExpr(items), i + 1
-            expr, i = _parse_one(tokens, i)
-            items.append(expr)
-        raise ParseError("expected ')'")
-
-    if tok == ')':
-        raise ParseError("unexpected ')'")
-
-    # try integer → Bytes (variable-length two's complement)
-    try:
-        n = int(tok)
-        # encode as minimal-width signed two's complement, big-endian
-        def int_to_min_tc(v: int) -> bytes:
-            """Return the minimal-width signed two's complement big-endian
-            byte encoding of integer v. Width expands just enough so that
-            decoding with signed=True yields the same value and sign.
-            Example: 0 -> b"\x00", 127 -> b"\x7f", 128 -> b"\x00\x80".
-            """
-            if v == 0:
-                return b"\x00"
-            w = 1
-            while True:
-                try:
-                    return v.to_bytes(w, "big", signed=True)
-                except OverflowError:
-                    w += 1
-
-        return Expr.Bytes(int_to_min_tc(n)), pos + 1
-    except ValueError:
-        return Expr.Symbol(tok), pos + 1
+    # open lists awaiting their ')', innermost last
+    stack: List[List[Expr]] = []
+    end = len(tokens)
+    while True:
+        if pos >= end:
+            raise ParseError("expected ')'" if stack else "unexpected end")
+        tok = tokens[pos]
+        pos += 1
+
+        if tok == '(':
+            stack.append([])
+            continue
+        if tok == ')':
+            if not stack:
+                raise ParseError("unexpected ')'")
+            expr: Expr = Expr.ListExpr(stack.pop())
+        else:
+            expr = _parse_atom(tok)
+
+        if not stack:
+            return expr, pos
+        stack[-1].append(expr)
 
 def parse(tokens: List[str]) -> Tuple[Expr, List[str]]:
     """Parse tokens into an Expr and return (expr, remaining_tokens)."""
     expr, next_pos = _parse_one(tokens, 0)
     return expr, tokens[next_pos:]
+
+
+@lru_cache(maxsize=1024)
+def parse_source(source: str) -> Expr:
+    """Tokenize and parse exactly one expression from source text.
+
+    Results are cached per source string and shared between callers, which
+    must not mutate them. Raises ParseError if the source is empty, malformed
+    or has tokens after the expression.
+    """
+    tokens = tokenize(source)
+    if not tokens:
+        raise ParseError("no expression provided")
+    try:
+        expr, rest = parse(tokens)
+    except ParseError as exc:
+        raise ParseError(f"parse error: {exc}") from exc
+    if rest:
+        raise ParseError("unexpected tokens after expression")
+    return expr
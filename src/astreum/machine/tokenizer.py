@@ -1,90 +1,92 @@
+import re
 from typing import List
 
+# without datum comments, tokens are parens and runs of anything but
+# whitespace, parens and ';'; a line comment matches as an empty group 1
+_FIND_TOKENS = re.compile(r";[^\n]*|([()]|[^\s();]+)").findall
 
-def tokenize(source: str) -> List[str]:
-    tokens: List[str] = []
-    cur: List[str] = []
+# with datum comments, '#;' also ends a token and is matched on its own
+_SCAN = re.compile(r"(\s+|;[^\n]*)|([()])|(#;)|((?:[^\s();#]|#(?!;))+)").match
+
+
+def _skip_line_comment(source: str, idx: int) -> int:
     n = len(source)
-    i = 0
+    while idx < n and source[idx] != "\n":
+        idx += 1
+    return idx
 
-    def flush_cur() -> None:
-        if cur:
-            tokens.append("".join(cur))
-            cur.clear()
 
-    def skip_line_comment(idx: int) -> int:
-        while idx < n and source[idx] != "\n":
+def _skip_ws_and_comments(source: str, idx: int) -> int:
+    n = len(source)
+    while idx < n:
+        ch = source[idx]
+        if ch.isspace():
             idx += 1
-        return idx
+            continue
+        if ch == ";":
+            idx = _skip_line_comment(source, idx + 1)
+            continue
+        break
+    return idx
+
 
-    def skip_ws_and_comments(idx: int) -> int:
+def _skip_expression(source: str, idx: int) -> int:
+    """Return the index just past the expression a '#;' datum comment drops."""
+    n = len(source)
+    idx = _skip_ws_and_comments(source, idx)
+    if idx >= n:
+        return n
+    ch = source[idx]
+    if ch == "(":
+        depth = 0
         while idx < n:
             ch = source[idx]
-            if ch.isspace():
-                flush_cur()
+            if ch == "(":
+                depth += 1
+                idx += 1
+                continue
+            if ch == ")":
+                depth -= 1
                 idx += 1
+                if depth == 0:
+                    break
                 continue
             if ch == ";":
-                flush_cur()
-                idx = skip_line_comment(idx + 1)
+                idx = _skip_line_comment(source, idx + 1)
                 continue
-            break
-        return idx
-
-    def skip_expression(idx: int) -> int:
-        idx = skip_ws_and_comments(idx)
-        if idx >= n:
-            return n
-        ch = source[idx]
-        if ch == "(":
-            depth = 0
-            while idx < n:
-                ch = source[idx]
-                if ch == "(":
-                    depth += 1
-                    idx += 1
-                    continue
-                if ch == ")":
-                    depth -= 1
-                    idx += 1
-                    if depth == 0:
-                        break
-                    continue
-                if ch == ";":
-                    idx = skip_line_comment(idx + 1)
-                    continue
-                if ch == "#" and idx + 1 < n and source[idx + 1] == ";":
-                    idx = skip_expression(idx + 2)
-                    continue
-                idx += 1
-            return idx
-        if ch == ")":
-            return idx + 1
-        while idx < n:
-            ch = source[idx]
-            if ch.isspace() or ch in ("(", ")", ";"):
-                break
             if ch == "#" and idx + 1 < n and source[idx + 1] == ";":
-                break
+                idx = _skip_expression(source, idx + 2)
+                continue
             idx += 1
         return idx
+    if ch == ")":
+        return idx + 1
+    while idx < n:
+        ch = source[idx]
+        if ch.isspace() or ch in ("(", ")", ";"):
+            break
+        if ch == "#" and idx + 1 < n and source[idx + 1] == ";":
+            break
+        idx += 1
+    return idx
 
+
+def tokenize(source: str) -> List[str]:
+    # the common case is a single C-level regex scan
+    if "#;" not in source:
+        return [tok for tok in _FIND_TOKENS(source) if tok]
+
+    tokens: List[str] = []
+    n = len(source)
+    i = 0
     while i < n:
-        i = skip_ws_and_comments(i)
-        if i >= n:
-            break
-        ch = source[i]
-        if ch == "#" and i + 1 < n and source[i + 1] == ";":
-            flush_cur()
-            i = skip_expression(i + 2)
+        m = _SCAN(source, i)
+        i = m.end()
+        kind = m.lastindex
+        if kind == 1:
             continue
-        if ch in ("(", ")"):
-            flush_cur()
-            tokens.append(ch)
-            i += 1
+        if kind == 3:
+            i = _skip_expression(source, i)
             continue
-        cur.append(ch)
-        i += 1
-
-    flush_cur()
+        tokens.append(m.group(kind))
     return tokens
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import threading
 import uuid
-from typing import Dict
+from typing import Dict, Tuple
 
 from astreum.communication.start import connect_to_network_and_verify
 from astreum.communication.models.peer import (
@@ -13,7 +13,7 @@ from astreum.communication.models.peer import (
     get_peer as peers_get_peer,
     remove_peer as peers_remove_peer,
 )
-from astreum.consensus.start import process_blocks_and_transactions
+from astreum.consensus.start import process_blocks_and_transactions, wait_for_new_block
 from astreum.machine import Expr, high_eval, low_eval, script_eval
 from astreum.machine.models.environment import Env, env_get, env_set
 from astreum.machine.models.expression import get_expr_list_from_storage
@@ -23,10 +23,12 @@ from astreum.storage.actions.get import (
     _cold_storage_get,
     _network_get,
     storage_get,
+    storage_get_many,
     local_get,
 )
 from astreum.storage.actions.set import (
     _hot_storage_set,
+    _hot_storage_set_many,
     _cold_storage_set,
     _network_set,
 )
@@ -52,11 +54,17 @@ class Node:
 
         # Machine Setup
         self.environments: Dict[uuid.UUID, Env] = {}
+        # storage-free low_eval programs -> (result bytes, meter cost)
+        self.low_eval_cache: Dict[Tuple[bytes, ...], Tuple[bytes, int]] = {}
         self.machine_environments_lock = threading.RLock()
         self.is_connected = False
 
+        # notified whenever latest_block_hash changes
+        self.latest_block_condition = threading.Condition()
+
     connect = connect_to_network_and_verify
     validate = process_blocks_and_transactions
+    wait_for_new_block = wait_for_new_block
 
     low_eval = low_eval
     high_eval = high_eval
@@ -73,10 +81,12 @@ class Node:
 
     ## Set
     _hot_storage_set = _hot_storage_set
+    _hot_storage_set_many = _hot_storage_set_many
     _cold_storage_set = _cold_storage_set
     _network_set = _network_set
 
     storage_get = storage_get
+    storage_get_many = storage_get_many
     local_get = local_get
 
     get_expr_list_from_storage = get_expr_list_from_storage
@@ -1,28 +1,36 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Optional
+import logging
+import mmap
+import os
+from typing import List, Optional, Sequence
 
 from ..models.atom import Atom
 
+# legacy atom files at least this large are parsed from a mapping, not read
+MMAP_READ_THRESHOLD = 16 * 1024
+
 
 def _hot_storage_get(self, key: bytes) -> Optional[Atom]:
     """Retrieve an atom from in-memory cache while tracking hit statistics."""
     atom = self.hot_storage.get(key)
     if atom is not None:
-        self.hot_storage_hits[key] = self.hot_storage_hits.get(key, 0) + 1
-        self.logger.debug("Hot storage hit for %s", key.hex())
-    else:
-        self.logger.debug("Hot storage miss for %s", key.hex())
+        self.hot_storage_hits[key] += 1
+    if self.logger.isEnabledFor(logging.DEBUG):
+        if atom is not None:
+            self.logger.debug("Hot storage hit for %s", key.hex())
+        else:
+            self.logger.debug("Hot storage miss for %s", key.hex())
     return atom
 
 
 def _network_get(self, key: bytes) -> Optional[Atom]:
     """Attempt to fetch an atom from network peers when local storage misses."""
+    key_hex = key.hex()
     if not getattr(self, "is_connected", False):
-        self.logger.debug("Network fetch skipped for %s; node not connected", key.hex())
+        self.logger.debug("Network fetch skipped for %s; node not connected", key_hex)
         return None
-    self.logger.debug("Attempting network fetch for %s", key.hex())
+    self.logger.debug("Attempting network fetch for %s", key_hex)
     try:
         from ...communication.handlers.object_request import (
             ObjectRequest,
@@ -32,7 +40,7 @@ def _network_get(self, key: bytes) -> Optional[Atom]:
     except Exception as exc:
         self.logger.warning(
             "Communication module unavailable; cannot fetch %s: %s",
-            key.hex(),
+            key_hex,
             exc,
         )
         return None
@@ -40,11 +48,11 @@ def _network_get(self, key: bytes) -> Optional[Atom]:
     try:
         closest_peer = self.peer_route.closest_peer_for_hash(key)
     except Exception as exc:
-        self.logger.warning("Peer lookup failed for %s: %s", key.hex(), exc)
+        self.logger.warning("Peer lookup failed for %s: %s", key_hex, exc)
         return None
 
     if closest_peer is None or closest_peer.address is None:
-        self.logger.debug("No peer available to fetch %s", key.hex())
+        self.logger.debug("No peer available to fetch %s", key_hex)
         return None
 
     obj_req = ObjectRequest(
@@ -56,10 +64,10 @@ def _network_get(self, key: bytes) -> Optional[Atom]:
         message = Message(
             topic=MessageTopic.OBJECT_REQUEST,
             content=obj_req.to_bytes(),
-            sender=self.relay_public_key,
+            sender_bytes=self.relay_public_key_bytes,
         )
     except Exception as exc:
-        self.logger.warning("Failed to build object request for %s: %s", key.hex(), exc)
+        self.logger.warning("Failed to build object request for %s: %s", key_hex, exc)
         return None
 
     # encrypt the outbound request for the target peer
@@ -68,19 +76,19 @@ def _network_get(self, key: bytes) -> Optional[Atom]:
     try:
         self.add_atom_req(key)
     except Exception as exc:
-        self.logger.warning("Failed to track object request for %s: %s", key.hex(), exc)
+        self.logger.warning("Failed to track object request for %s: %s", key_hex, exc)
 
     try:
         self.outgoing_queue.put((message.to_bytes(), closest_peer.address))
         self.logger.debug(
             "Queued OBJECT_GET for %s to peer %s",
-            key.hex(),
+            key_hex,
             closest_peer.address,
         )
     except Exception as exc:
         self.logger.warning(
             "Failed to queue OBJECT_GET for %s to %s: %s",
-            key.hex(),
+            key_hex,
             closest_peer.address,
             exc,
         )
@@ -89,19 +97,25 @@ def _network_get(self, key: bytes) -> Optional[Atom]:
 
 def storage_get(self, key: bytes) -> Optional[Atom]:
     """Retrieve an Atom by checking local storage first, then the network."""
-    self.logger.debug("Fetching atom %s", key.hex())
+    # hex ids are only built when they will be logged; hits stay allocation-free
+    debug = self.logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        self.logger.debug("Fetching atom %s", key.hex())
     atom = self._hot_storage_get(key)
     if atom is not None:
-        self.logger.debug("Returning atom %s from hot storage", key.hex())
+        if debug:
+            self.logger.debug("Returning atom %s from hot storage", key.hex())
         return atom
     atom = self._cold_storage_get(key)
     if atom is not None:
-        self.logger.debug("Returning atom %s from cold storage", key.hex())
+        if debug:
+            self.logger.debug("Returning atom %s from cold storage", key.hex())
         return atom
     
     if not self.is_connected:
         return None
     
+    key_hex = key.hex()
     provider_payload = self.storage_index.get(key)
     if provider_payload is not None:
         try:
@@ -125,59 +139,133 @@ def storage_get(self, key: bytes) -> Optional[Atom]:
             message = Message(
                 topic=MessageTopic.OBJECT_REQUEST,
                 content=obj_req.to_bytes(),
-                sender=self.relay_public_key,
+                sender_bytes=self.relay_public_key_bytes,
             )
             message.encrypt(shared_key_bytes)
             self.add_atom_req(key)
             self.outgoing_queue.put((message.to_bytes(), (provider_address, provider_port)))
             self.logger.debug(
                 "Requested atom %s from indexed provider %s:%s",
-                key.hex(),
+                key_hex,
                 provider_address,
                 provider_port,
             )
         except Exception as exc:
-            self.logger.warning("Failed indexed fetch for %s: %s", key.hex(), exc)
+            self.logger.warning("Failed indexed fetch for %s: %s", key_hex, exc)
         return None
 
-    self.logger.debug("Falling back to network fetch for %s", key.hex())
+    self.logger.debug("Falling back to network fetch for %s", key_hex)
     return self._network_get(key)
 
 
+def storage_get_many(self, keys: Sequence[bytes]) -> List[Optional[Atom]]:
+    """Retrieve several Atoms in order, serving hot-storage hits in one pass.
+
+    Keys missing from hot storage fall back to storage_get individually.
+    """
+    self.logger.debug("Fetching %s atoms", len(keys))
+    hot_storage = self.hot_storage
+    hits = self.hot_storage_hits
+    atoms: List[Optional[Atom]] = []
+    for key in keys:
+        atom = hot_storage.get(key)
+        if atom is not None:
+            hits[key] += 1
+        else:
+            atom = self.storage_get(key)
+        atoms.append(atom)
+    return atoms
+
+
 def local_get(self, key: bytes) -> Optional[Atom]:
     """Retrieve an Atom by checking only local hot and cold storage."""
-    self.logger.debug("Fetching atom %s (local only)", key.hex())
+    debug = self.logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        self.logger.debug("Fetching atom %s (local only)", key.hex())
     atom = self._hot_storage_get(key)
     if atom is not None:
-        self.logger.debug("Returning atom %s from hot storage", key.hex())
+        if debug:
+            self.logger.debug("Returning atom %s from hot storage", key.hex())
         return atom
     atom = self._cold_storage_get(key)
     if atom is not None:
-        self.logger.debug("Returning atom %s from cold storage", key.hex())
+        if debug:
+            self.logger.debug("Returning atom %s from cold storage", key.hex())
         return atom
-    self.logger.debug("Local storage miss for %s", key.hex())
+    if debug:
+        self.logger.debug("Local storage miss for %s", key.hex())
     return None
 
 
+def _read_atom_file(file_path: str) -> Atom:
+    """Decode an atom file with bare fd calls, skipping the io buffering read_bytes sets up.
+
+    Large files are mapped and parsed in place, so the payload is copied once
+    into the Atom rather than read into a buffer and then sliced out of it.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size >= MMAP_READ_THRESHOLD:
+            mapping = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+            try:
+                with memoryview(mapping) as view:
+                    return Atom.from_bytes(view)
+            finally:
+                mapping.close()
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
+    return Atom.from_bytes(data)
+
+
 def _cold_storage_get(self, key: bytes) -> Optional[Atom]:
-    """Read an atom from the cold storage directory if configured."""
+    """Read an atom from the cold storage log, or a legacy per-atom file, if configured."""
+    debug = self.logger.isEnabledFor(logging.DEBUG)
     if not self.config["cold_storage_path"]:
-        self.logger.debug("Cold storage disabled; cannot fetch %s", key.hex())
+        if debug:
+            self.logger.debug("Cold storage disabled; cannot fetch %s", key.hex())
+        return None
+    cold_log = self.cold_storage_log
+    if cold_log is not None:
+        try:
+            atom = cold_log.get_atom(key)
+        except ValueError as exc:
+            self.logger.warning("Cold storage log corrupted for %s: %s", key.hex(), exc)
+            return None
+        except OSError as exc:
+            self.logger.warning("Error reading cold storage log %s: %s", cold_log.path, exc)
+            atom = None
+        if atom is not None:
+            if debug:
+                self.logger.debug("Loaded atom %s from cold storage", key.hex())
+            return atom
+    # directories written before the log existed hold one <HEX>.bin file per
+    # atom; those were listed at startup, so a miss costs no stat call
+    if key not in self.cold_storage_files:
+        if debug:
+            self.logger.debug("Cold storage miss for %s", key.hex())
         return None
-    filename = f"{key.hex().upper()}.bin"
-    file_path = Path(self.config["cold_storage_path"]) / filename
+    key_hex = key.hex()
+    file_path = self.cold_storage_dir + key_hex.upper() + ".bin"
     try:
-        data = file_path.read_bytes()
+        atom = _read_atom_file(file_path)
     except FileNotFoundError:
-        self.logger.debug("Cold storage miss for %s", key.hex())
+        self.cold_storage_files.discard(key)
+        self.logger.debug("Cold storage miss for %s", key_hex)
         return None
     except OSError as exc:
         self.logger.warning("Error reading cold storage file %s: %s", file_path, exc)
         return None
-    try:
-        atom = Atom.from_bytes(data)
-        self.logger.debug("Loaded atom %s from cold storage", key.hex())
-        return atom
     except ValueError as exc:
         self.logger.warning("Cold storage data corrupted for %s: %s", file_path, exc)
         return None
+    self.logger.debug("Loaded atom %s from cold storage", key_hex)
+    return atom
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import socket
-from pathlib import Path
+from typing import Iterable
 
 from cryptography.hazmat.primitives import serialization
 
@@ -33,16 +32,56 @@ def _hot_storage_set(self, key: bytes, value: Atom) -> bool:
     return True
 
 
+def _hot_storage_set_many(self, atoms: Iterable[Atom]) -> int:
+    """Store a batch of atoms in hot storage in one pass; returns how many were stored.
+
+    Atoms that would exceed the configured limit are skipped individually, as
+    with _hot_storage_set, but logging happens once per batch.
+    """
+    hot_storage = self.hot_storage
+    hot_limit = self.config["hot_storage_default_limit"]
+    total = self.hot_storage_size
+    stored = 0
+    skipped = 0
+    for atom in atoms:
+        projected = total + atom.size
+        if projected > hot_limit:
+            skipped += 1
+            continue
+        hot_storage[atom.object_id()] = atom
+        total = projected
+        stored += 1
+    self.hot_storage_size = total
+    if skipped:
+        self.logger.warning(
+            "Hot storage limit reached (%s); skipped %s of %s atoms",
+            hot_limit,
+            skipped,
+            stored + skipped,
+        )
+    self.logger.debug("Stored %s atoms in hot storage (total=%s)", stored, total)
+    return stored
+
+
 def _cold_storage_set(self, atom: Atom) -> None:
-    """Persist an atom into the cold storage directory if it already exists."""
+    """Append an atom to the cold storage log unless it is already stored."""
     node_logger = self.logger
     atom_id = atom.object_id()
     atom_hex = atom_id.hex()
     if not self.config["cold_storage_path"]:
         node_logger.debug("Cold storage disabled; skipping atom %s", atom_hex)
         return
+    cold_log = self.cold_storage_log
+    if cold_log is None:
+        node_logger.warning("Cold storage log unavailable; skipping atom %s", atom_hex)
+        return
+    if atom_id in cold_log or atom_id in self.cold_storage_files:
+        node_logger.debug("Atom %s already in cold storage", atom_hex)
+        return
     atom_bytes = atom.to_bytes()
-    projected = self.cold_storage_size + len(atom_bytes)
+    # project the log's own growth, record header included, so the check and
+    # cold_storage_size (the log size) stay in step
+    projected = self.cold_storage_size + cold_log.record_size(len(atom_bytes))
     cold_limit = self.config["cold_storage_limit"]
     if cold_limit and projected > cold_limit:
         node_logger.warning(
@@ -52,25 +91,15 @@ def _cold_storage_set(self, atom: Atom) -> None:
             atom_hex,
         )
         return
-    directory = Path(self.config["cold_storage_path"])
-    if not directory.exists():
-        node_logger.warning(
-            "Cold storage path %s missing; skipping atom %s",
-            directory,
-            atom_hex,
-        )
-        return
-    filename = f"{atom_hex.upper()}.bin"
-    file_path = directory / filename
     try:
-        file_path.write_bytes(atom_bytes)
-        self.cold_storage_size = projected
+        cold_log.append(atom_id, atom_bytes)
+        self.cold_storage_size = cold_log.size
         node_logger.debug("Persisted atom %s to cold storage", atom_hex)
     except OSError as exc:
         node_logger.error(
             "Failed writing atom %s to cold storage %s: %s",
             atom_hex,
-            file_path,
+            cold_log.path,
             exc,
         )
 
@@ -85,6 +114,7 @@ def _network_set(self, atom: Atom) -> None:
             ObjectRequest,
             ObjectRequestType,
         )
+        from ...communication.handlers.object_response import encode_object_provider
         from ...communication.models.message import Message, MessageTopic
     except Exception as exc:
         node_logger.warning(
@@ -95,7 +125,7 @@ def _network_set(self, atom: Atom) -> None:
         return
 
     try:
-        provider_ip, provider_port = self.incoming_socket.getsockname()[:2]
+        provider_ip, provider_port = self.incoming_address
     except Exception as exc:
         node_logger.warning(
             "Unable to determine provider address for atom %s: %s",
@@ -105,15 +135,13 @@ def _network_set(self, atom: Atom) -> None:
         return
 
     try:
-        provider_ip_bytes = socket.inet_aton(provider_ip)
-        provider_port_bytes = int(provider_port).to_bytes(2, "big", signed=False)
-        provider_key_bytes = self.relay_public_key_bytes
+        provider_payload = encode_object_provider(
+            self.relay_public_key_bytes, provider_ip, int(provider_port)
+        )
     except Exception as exc:
         node_logger.warning("Unable to encode provider info for %s: %s", atom_hex, exc)
         return
 
-    provider_payload = provider_key_bytes + provider_ip_bytes + provider_port_bytes
-
     try:
         closest_peer = self.peer_route.closest_peer_for_hash(atom_id)
     except Exception as exc:
@@ -157,7 +185,7 @@ def _network_set(self, atom: Atom) -> None:
     message = Message(
         topic=MessageTopic.OBJECT_REQUEST,
         content=message_body,
-        sender=self.relay_public_key,
+        sender_bytes=self.relay_public_key_bytes,
     )
     message.encrypt(closest_peer.shared_key_bytes)
     try:
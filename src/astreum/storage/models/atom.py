@@ -1,5 +1,6 @@
 
 
+import struct
 from enum import IntEnum
 from typing import List, Optional, Tuple
 
@@ -10,16 +11,38 @@ ZERO32 = b"\x00"*32
 def u64_le(n: int) -> bytes:
     return int(n).to_bytes(8, "little", signed=False)
 
+# payloads at least this large are hashed with BLAKE3's internal multithreading;
+# below it, thread start-up costs more than it saves
+PARALLEL_HASH_THRESHOLD = 128 * 1024
+
 def hash_bytes(b: bytes) -> bytes:
+    if len(b) >= PARALLEL_HASH_THRESHOLD:
+        return blake3(b, max_threads=blake3.AUTO).digest()
     return blake3(b).digest()
 
+# kind byte + data hash + next id + little-endian u64 size
+_ID_PREIMAGE = struct.Struct("<B32s32sQ")
+
+def object_id_from_parts(kind: int, data_hash: bytes, next_id: bytes, size: int) -> bytes:
+    """Compute an atom id from its metadata without building an Atom."""
+    # struct would silently pad or truncate; ids must be exact
+    if len(data_hash) != 32 or len(next_id) != 32:
+        raise ValueError("atom data hash and next id must be 32 bytes")
+    return blake3(_ID_PREIMAGE.pack(kind, data_hash, next_id, size)).digest()
+
 class AtomKind(IntEnum):
     SYMBOL = 0
     BYTES = 1
     LIST = 2
 
+# kind lookups used on every (de)serialization
+_KIND_BYTES = {kind: bytes((kind.value,)) for kind in AtomKind}
+_KINDS_BY_VALUE = {kind.value: kind for kind in AtomKind}
+
 
 class Atom:
+    __slots__ = ("data", "kind", "next_id", "size", "_data_hash", "_object_id")
+
     data: bytes
     kind: AtomKind
     next_id: bytes
@@ -30,20 +53,24 @@ class Atom:
         self.kind = kind
         self.next_id = next_id
         self.size = len(data)
-        
+        # atoms are immutable once built, so hashes are computed at most once
+        self._data_hash: Optional[bytes] = None
+        self._object_id: Optional[bytes] = None
+
 
     def generate_id(self) -> bytes:
         """Compute the object id using this atom's metadata."""
-        kind_bytes = int(self.kind).to_bytes(1, "little", signed=False)
-        return blake3(
-            kind_bytes + self.data_hash() + self.next_id + u64_le(self.size)
-        ).digest()
+        return object_id_from_parts(self.kind, self.data_hash(), self.next_id, self.size)
 
     def data_hash(self) -> bytes:
-        return hash_bytes(self.data)
+        if self._data_hash is None:
+            self._data_hash = hash_bytes(self.data)
+        return self._data_hash
 
     def object_id(self) -> bytes:
-        return self.generate_id()
+        if self._object_id is None:
+            self._object_id = self.generate_id()
+        return self._object_id
 
     @staticmethod
     def verify_metadata(
@@ -53,28 +80,25 @@ class Atom:
         data_hash: bytes,
         kind: AtomKind,
     ) -> bool:
-        kind_bytes = int(kind).to_bytes(1, "little", signed=False)
-        expected = blake3(kind_bytes + data_hash + next_hash + u64_le(size)).digest()
-        return object_id == expected
+        try:
+            return object_id == object_id_from_parts(kind, data_hash, next_hash, size)
+        except ValueError:
+            return False
 
     def to_bytes(self) -> bytes:
         """Serialize as next-hash + kind byte + payload."""
-        kind_byte = int(self.kind).to_bytes(1, "little", signed=False)
-        return self.next_id + kind_byte + self.data
+        return b"".join((self.next_id, _KIND_BYTES[self.kind], self.data))
 
     @staticmethod
     def from_bytes(buf: bytes) -> "Atom":
-        header_len = len(ZERO32)
-        if len(buf) < header_len + 1:
+        if len(buf) < 33:
             raise ValueError("buffer too short for Atom header")
-        next_hash = buf[:header_len]
-        kind_value = buf[header_len]
-        data = buf[header_len + 1 :]
-        try:
-            kind = AtomKind(kind_value)
-        except ValueError as exc:
-            raise ValueError(f"unknown atom kind: {kind_value}") from exc
-        return Atom(data=data, next_id=next_hash, kind=kind)
+        kind_value = buf[32]
+        kind = _KINDS_BY_VALUE.get(kind_value)
+        if kind is None:
+            raise ValueError(f"unknown atom kind: {kind_value}")
+        # bytes() is free for bytes input and takes a single copy out of a view
+        return Atom(data=bytes(buf[33:]), next_id=bytes(buf[:32]), kind=kind)
 
 def bytes_list_to_atoms(values: List[bytes]) -> Tuple[bytes, List[Atom]]:
     """Build a forward-ordered linked list of atoms from byte payloads.
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .atom import Atom
+
+LOG_FILENAME = "atoms.log"
+
+# atom id + big-endian u32 length of the serialized atom that follows
+_RECORD_HEADER = struct.Struct(">32sI")
+
+
+class AtomLog:
+    """Append-only cold storage file with an in-memory id -> (offset, length) index.
+
+    Every record is ``atom_id || len || atom_bytes``. The index is rebuilt by
+    one scan when the log is opened; after that, membership checks are dict
+    lookups, writes are a single append, and reads are slices of an mmap.
+    """
+
+    def __init__(self, directory: Path):
+        self.path = Path(directory) / LOG_FILENAME
+        self.index: Dict[bytes, Tuple[int, int]] = {}
+        self.size = 0
+        self._lock = threading.Lock()
+        self._map: Optional[mmap.mmap] = None
+        self._fd = os.open(
+            self.path,
+            os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self._scan()
+
+    def _scan(self) -> None:
+        file_size = os.fstat(self._fd).st_size
+        offset = 0
+        if file_size:
+            view = mmap.mmap(self._fd, file_size, access=mmap.ACCESS_READ)
+            try:
+                while offset + _RECORD_HEADER.size <= file_size:
+                    atom_id, length = _RECORD_HEADER.unpack_from(view, offset)
+                    start = offset + _RECORD_HEADER.size
+                    if start + length > file_size:
+                        break
+                    self.index[atom_id] = (start, length)
+                    offset = start + length
+            finally:
+                view.close()
+        if offset != file_size:
+            # drop a record torn by a crash mid-append
+            os.ftruncate(self._fd, offset)
+        self.size = offset
+
+    def __contains__(self, atom_id: bytes) -> bool:
+        return atom_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @staticmethod
+    def record_size(length: int) -> int:
+        """Bytes a record holding ``length`` bytes of atom data adds to the log."""
+        return _RECORD_HEADER.size + length
+
+    def append(self, atom_id: bytes, data: bytes) -> bool:
+        """Append ``data`` under ``atom_id``; returns False if it is already stored."""
+        record = _RECORD_HEADER.pack(atom_id, len(data)) + data
+        with self._lock:
+            if atom_id in self.index:
+                return False
+            view = memoryview(record)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+            self.index[atom_id] = (self.size + _RECORD_HEADER.size, len(data))
+            self.size += len(record)
+        return True
+
+    def _mapping(self, end: int) -> mmap.mmap:
+        """Return a read mapping covering ``end`` bytes; call with the lock held."""
+        view = self._map
+        if view is None or end > len(view):
+            # appends outgrew the mapping; remap to the current end of file
+            if view is not None:
+                view.close()
+            view = self._map = mmap.mmap(self._fd, self.size, access=mmap.ACCESS_READ)
+        return view
+
+    def get(self, atom_id: bytes) -> Optional[bytes]:
+        entry = self.index.get(atom_id)
+        if entry is None:
+            return None
+        offset, length = entry
+        with self._lock:
+            return self._mapping(offset + length)[offset:offset + length]
+
+    def get_atom(self, atom_id: bytes) -> Optional[Atom]:
+        """Decode the atom stored under ``atom_id`` straight from the mapping.
+
+        Atom.from_bytes copies the payload out of the view, so each read costs
+        one copy instead of a record copy and then a payload copy. Raises
+        ValueError if the record does not decode.
+        """
+        entry = self.index.get(atom_id)
+        if entry is None:
+            return None
+        offset, length = entry
+        with self._lock:
+            # the view must be gone before a later remap can close the mapping
+            with memoryview(self._mapping(offset + length)) as view:
+                return Atom.from_bytes(view[offset:offset + length])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
@@ -31,14 +31,16 @@ class TrieNode:
         self.child_0 = child_0
         self.child_1 = child_1
         self._hash: Optional[bytes] = None
+        # rendered atom chain and serialization, cleared together with _hash
+        self._atoms: Optional[List[Atom]] = None
+        self._bytes: Optional[bytes] = None
 
     def hash(self) -> bytes:
         """
         Compute and cache the canonical hash for this node (its type-atom id).
         """
         if self._hash is None:
-            head_hash, _ = self._render_atoms()
-            self._hash = head_hash
+            self._hash, self._atoms = self._render_atoms()
         return self._hash
 
     def to_bytes(self) -> bytes:
@@ -46,11 +48,13 @@ class TrieNode:
         Serialize for hashing: key_len (u16 big-endian) + key payload +
         child_0 (or ZERO32) + child_1 (or ZERO32) + value.
         """
-        key_len_bytes = self.key_len.to_bytes(2, "big", signed=False)
-        child0 = self.child_0 or ZERO32
-        child1 = self.child_1 or ZERO32
-        value = self.value or b""
-        return key_len_bytes + self.key + child0 + child1 + value
+        if self._bytes is None:
+            key_len_bytes = self.key_len.to_bytes(2, "big", signed=False)
+            child0 = self.child_0 or ZERO32
+            child1 = self.child_1 or ZERO32
+            value = self.value or b""
+            self._bytes = key_len_bytes + self.key + child0 + child1 + value
+        return self._bytes
     
     def _render_atoms(self) -> Tuple[bytes, List[Atom]]:
         """
@@ -82,9 +86,9 @@ class TrieNode:
         return type_atom.object_id(), atoms
 
     def to_atoms(self) -> Tuple[bytes, List[Atom]]:
-        head_hash, atoms = self._render_atoms()
-        self._hash = head_hash
-        return head_hash, atoms
+        if self._hash is None or self._atoms is None:
+            self._hash, self._atoms = self._render_atoms()
+        return self._hash, list(self._atoms)
 
     @classmethod
     def from_atoms(
@@ -163,10 +167,15 @@ class Trie:
         total_bits = len(key) * 8
         if key_bit_offset + prefix_len > total_bits:
             return False
-        for i in range(prefix_len):
-            if cls._bit(prefix, i) != cls._bit(key, key_bit_offset + i):
-                return False
-        return True
+        if prefix_len <= 0:
+            return True
+        prefix_bits = len(prefix) * 8
+        if prefix_len > prefix_bits:
+            raise IndexError("prefix shorter than prefix_len bits")
+        # compare both bit windows as whole integers instead of bit by bit
+        want = int.from_bytes(prefix, "big") >> (prefix_bits - prefix_len)
+        have = int.from_bytes(key, "big") >> (total_bits - key_bit_offset - prefix_len)
+        return have & ((1 << prefix_len) - 1) == want
 
     def _fetch(self, storage_node: "Node", h: bytes) -> Optional[TrieNode]:
         """
@@ -181,6 +190,9 @@ class Trie:
             return None
 
         pat_node = TrieNode.from_atoms(storage_node, h)
+        # atoms are content-addressed, so the head id we fetched by is the
+        # node's hash; seed it rather than re-rendering the chain to find it
+        pat_node._hash = h
         self.nodes[h] = pat_node
         return pat_node
 
@@ -192,35 +204,49 @@ class Trie:
         if self.root_hash is None:
             return None
 
-        current = self._fetch(storage_node, self.root_hash)
+        # cached nodes are taken straight from the dict; _fetch only on a miss
+        nodes_get = self.nodes.get
+        current = nodes_get(self.root_hash) or self._fetch(storage_node, self.root_hash)
         if current is None:
             return None
 
         key_pos = 0  # bit offset into key
+        key_bits = len(key) * 8
+        # the search key is converted once; prefix checks and routing bits
+        # below are shifts and masks on it (_match_prefix/_bit, inlined)
+        key_int = int.from_bytes(key, "big")
 
         while current is not None:
             # 1) Check that this node's prefix matches the key here
-            if not self._match_prefix(current.key, current.key_len, key, key_pos):
+            prefix_len = current.key_len
+            if prefix_len > 0:
+                if key_pos + prefix_len > key_bits:
+                    return None
+                prefix_bits = len(current.key) * 8
+                if prefix_len > prefix_bits:
+                    raise IndexError("prefix shorter than prefix_len bits")
+                want = int.from_bytes(current.key, "big") >> (prefix_bits - prefix_len)
+                have = (key_int >> (key_bits - key_pos - prefix_len)) & ((1 << prefix_len) - 1)
+                if have != want:
+                    return None
+            elif key_pos > key_bits:
                 return None
-            key_pos += current.key_len
+            key_pos += prefix_len
 
             # 2) If we've consumed all bits of the search key:
-            if key_pos == len(key) * 8:
+            if key_pos == key_bits:
                 # Return value only if this node actually stores one
                 return current.value
 
             # 3) Decide which branch to follow via next bit
-            try:
-                next_bit = self._bit(key, key_pos)
-            except IndexError:
-                return None
+            next_bit = (key_int >> (key_bits - 1 - key_pos)) & 1
 
             child_hash = current.child_1 if next_bit else current.child_0
             if child_hash is None:
                 return None  # dead end
 
             # 4) Fetch child and continue descent
-            current = self._fetch(storage_node, child_hash)
+            current = nodes_get(child_hash) or self._fetch(storage_node, child_hash)
             if current is None:
                 return None  # dangling pointer
 
@@ -373,11 +399,14 @@ class Trie:
         key_pos: int,
         value: bytes,
     ) -> None:
-        # ➊—find longest-common-prefix (lcp) as before …
+        # ➊—find longest-common-prefix (lcp): xor the two bit windows as
+        # integers; the highest differing bit ends the common run
         max_lcp = min(node.key_len, len(key) * 8 - key_pos)
         lcp = 0
-        while lcp < max_lcp and self._bit(node.key, lcp) == self._bit(key, key_pos + lcp):
-            lcp += 1
+        if max_lcp > 0:
+            ours = int.from_bytes(node.key, "big") >> (len(node.key) * 8 - max_lcp)
+            theirs = int.from_bytes(key, "big") >> (len(key) * 8 - key_pos - max_lcp)
+            lcp = max_lcp - ((ours ^ theirs) & ((1 << max_lcp) - 1)).bit_length()
 
         # divergence bit values (taken **before** we mutate node.key)
         old_div_bit = self._bit(node.key, lcp)
@@ -421,17 +450,9 @@ class Trie:
         internal_hash = internal.hash()
         self.nodes[internal_hash] = internal
 
-        if not stack:
-            self.root_hash = internal_hash
-            return
-
-        parent, _, dir_bit = stack.pop()
-        if dir_bit == 0:
-            parent.child_0 = internal_hash
-        else:
-            parent.child_1 = internal_hash
-        self._invalidate_hash(parent)
-        self._bubble(stack, parent.hash())
+        # _bubble re-keys every rehashed ancestor in self.nodes (or just sets
+        # the root when the split node was the root)
+        self._bubble(stack, internal_hash)
 
 
     def _make_node(
@@ -447,8 +468,10 @@ class Trie:
         return node
 
     def _invalidate_hash(self, node: TrieNode) -> None:
-        """Clear cached hash so next .hash() recomputes."""
+        """Clear cached hash and atoms so next .hash() recomputes."""
         node._hash = None  # type: ignore
+        node._atoms = None  # type: ignore
+        node._bytes = None  # type: ignore
 
     def _bubble(
         self,
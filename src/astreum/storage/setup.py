@@ -1,6 +1,24 @@
 from __future__ import annotations
 
-from typing import Any
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Set
+
+from .models.atom_log import AtomLog
+
+
+def _list_atom_files(directory: Path) -> Set[bytes]:
+    """Return the ids of atoms stored as individual <HEX>.bin files in ``directory``."""
+    ids: Set[bytes] = set()
+    for file_path in directory.glob("*.bin"):
+        try:
+            atom_id = bytes.fromhex(file_path.stem)
+        except ValueError:
+            continue
+        if len(atom_id) == 32:
+            ids.add(atom_id)
+    return ids
 
 
 def storage_setup(node: Any, config: dict) -> None:
@@ -9,10 +27,29 @@ def storage_setup(node: Any, config: dict) -> None:
     node.logger.info("Setting up node storage")
 
     node.hot_storage = {}
-    node.hot_storage_hits = {}
+    node.hot_storage_hits = Counter()
     node.storage_index = {}
+    # block id -> decoded block fields, filled by Block.from_atom
+    node.block_fields_cache = {}
     node.hot_storage_size = 0
     node.cold_storage_size = 0
+    node.cold_storage_log = None
+    node.cold_storage_files = set()
+    # legacy file paths are built by string concatenation onto this prefix
+    node.cold_storage_dir = ""
+    if config["cold_storage_path"]:
+        node.cold_storage_dir = os.path.join(str(config["cold_storage_path"]), "")
+        node.cold_storage_files = _list_atom_files(Path(config["cold_storage_path"]))
+        try:
+            node.cold_storage_log = AtomLog(Path(config["cold_storage_path"]))
+        except OSError as exc:
+            node.logger.warning(
+                "Unable to open cold storage log in %s: %s",
+                config["cold_storage_path"],
+                exc,
+            )
+        else:
+            node.cold_storage_size = node.cold_storage_log.size
 
     node.logger.info(
         "Storage ready (hot_limit=%s bytes, cold_limit=%s bytes, cold_path=%s)",
@@ -5,21 +5,31 @@ from typing import Optional, Union
 ByteLike = Union[bytes, bytearray, memoryview]
 
 
+def _encode_int(value: int) -> bytes:
+    if value == 0:
+        return b"\x00"
+    length = (value.bit_length() + 7) // 8
+    return value.to_bytes(length, "little", signed=False)
+
+
+# counters, fees and most balances are small; encode those once up front
+_SMALL_INT_LIMIT = 1024
+_SMALL_INT_BYTES = tuple(_encode_int(n) for n in range(_SMALL_INT_LIMIT))
+
+
 def int_to_bytes(value: Optional[int]) -> bytes:
     """Convert an integer to a little-endian byte string with minimal length."""
     if value is None:
         return b""
     value = int(value)
-    if value == 0:
-        return b"\x00"
-    length = (value.bit_length() + 7) // 8
-    return value.to_bytes(length, "little", signed=False)
+    if 0 <= value < _SMALL_INT_LIMIT:
+        return _SMALL_INT_BYTES[value]
+    return _encode_int(value)
 
 
 def bytes_to_int(data: Optional[ByteLike]) -> int:
     """Convert a little-endian byte string to an integer."""
     if not data:
         return 0
-    if isinstance(data, memoryview):
-        data = data.tobytes()
-    return int.from_bytes(bytes(data), "little", signed=False)
+    # int.from_bytes reads any bytes-like object without an intermediate copy
+    return int.from_bytes(data, "little", signed=False)
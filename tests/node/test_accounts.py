@@ -0,0 +1,69 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.consensus.genesis import TREASURY_ADDRESS  # noqa: E402
+from astreum.consensus.models.account import Account  # noqa: E402
+from astreum.consensus.models.accounts import Accounts  # noqa: E402
+from astreum.node import Node  # noqa: E402
+from astreum.storage.models.trie import Trie  # noqa: E402
+from astreum.utils.integer import bytes_to_int, int_to_bytes  # noqa: E402
+
+STAKERS = [bytes([idx]) * 32 for idx in (1, 2, 3)]
+DEPOSITS = [
+    (STAKERS[0], 3),
+    (STAKERS[1], 5),
+    (STAKERS[0], 4),
+    (STAKERS[2], 1),
+    (STAKERS[1], 2),
+    (STAKERS[0], 7),
+]
+
+
+def _treasury() -> Account:
+    treasury = Account.create()
+    treasury.data = Trie()
+    return treasury
+
+
+class TestAccountsDataCredits(unittest.TestCase):
+    def setUp(self) -> None:
+        self.node = Node()
+
+    def test_credit_data_matches_per_transaction_stake_puts(self) -> None:
+        # one stake trie get/put per deposit, as apply_transaction used to do
+        direct = Accounts()
+        treasury = _treasury()
+        for staker, amount in DEPOSITS:
+            current = bytes_to_int(treasury.data.get(self.node, staker))
+            treasury.data.put(self.node, staker, int_to_bytes(current + amount))
+            treasury.balance += amount
+        direct.set_account(TREASURY_ADDRESS, treasury)
+        direct.update_trie(self.node)
+
+        staged = Accounts()
+        treasury = _treasury()
+        staged.set_account(TREASURY_ADDRESS, treasury)
+        for staker, amount in DEPOSITS:
+            staged.credit_data(TREASURY_ADDRESS, staker, amount)
+            treasury.balance += amount
+        staged.update_trie(self.node)
+
+        self.assertIsNotNone(staged.root_hash)
+        self.assertEqual(staged.root_hash, direct.root_hash)
+        self.assertEqual(bytes_to_int(treasury.data.get(self.node, STAKERS[0])), 14)
+
+    def test_credit_for_unknown_account_is_rejected(self) -> None:
+        accounts = Accounts()
+        accounts.credit_data(b"\x09" * 32, STAKERS[0], 1)
+        with self.assertRaisesRegex(ValueError, "unknown account"):
+            accounts.update_trie(self.node)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.consensus.models.block import Block  # noqa: E402
+from astreum.node import Node  # noqa: E402
+from astreum.storage.models.atom import ZERO32  # noqa: E402
+
+
+def _block() -> Block:
+    return Block(
+        chain_id=0,
+        previous_block_hash=ZERO32,
+        previous_block=None,
+        number=1,
+        timestamp=1234567890,
+        accounts_hash=b"a" * 32,
+        transactions_total_fees=0,
+        transactions_hash=b"t" * 32,
+        receipts_hash=b"r" * 32,
+        delay_difficulty=1,
+        validator_public_key=b"v" * 32,
+        signature=b"sig",
+        accounts=None,
+        transactions=None,
+        receipts=None,
+    )
+
+
+class TestBlockFromAtom(unittest.TestCase):
+    def test_decoded_fields_are_cached_per_node(self) -> None:
+        node_a = Node()
+        node_b = Node()
+        block_id, atoms = _block().to_atom()
+        node_a._hot_storage_set_many(atoms)
+
+        loaded = Block.from_atom(node_a, block_id)
+        self.assertEqual(loaded.number, 1)
+        self.assertEqual(loaded.signature, b"sig")
+        self.assertIn(block_id, node_a.block_fields_cache)
+
+        # node_b never stored the block; node_a's decoded copy must not leak
+        with self.assertRaises(ValueError):
+            Block.from_atom(node_b, block_id)
+        self.assertNotIn(block_id, node_b.block_fields_cache)
+
+        again = Block.from_atom(node_a, block_id)
+        self.assertIsNot(again, loaded)
+        self.assertEqual(again.atom_hash, block_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
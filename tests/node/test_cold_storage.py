@@ -0,0 +1,78 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.node import Node  # noqa: E402
+from astreum.storage.models.atom import Atom, AtomKind  # noqa: E402
+from astreum.storage.models.atom_log import LOG_FILENAME, AtomLog  # noqa: E402
+
+
+class TestColdStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _node(self) -> Node:
+        node = Node({"cold_storage_path": self.path})
+        self.addCleanup(node.cold_storage_log.close)
+        return node
+
+    def test_atoms_survive_reopening_the_log(self) -> None:
+        atoms = [Atom(data=f"cold-{i}".encode(), kind=AtomKind.BYTES) for i in range(3)]
+        node = self._node()
+        for atom in atoms:
+            node._cold_storage_set(atom)
+        node._cold_storage_set(atoms[0])
+        self.assertEqual(len(node.cold_storage_log), 3)
+        self.assertEqual(node._cold_storage_get(atoms[1].object_id()).data, atoms[1].data)
+
+        reopened = self._node()
+        self.assertEqual(reopened.cold_storage_size, node.cold_storage_size)
+        for atom in atoms:
+            self.assertEqual(reopened._cold_storage_get(atom.object_id()).object_id(), atom.object_id())
+
+    def test_limit_counts_record_headers(self) -> None:
+        atoms = [Atom(data=f"limit-{i}".encode(), kind=AtomKind.BYTES) for i in range(2)]
+        record = AtomLog.record_size(len(atoms[0].to_bytes()))
+        node = Node({"cold_storage_path": self.path, "cold_storage_limit": 2 * record - 1})
+        self.addCleanup(node.cold_storage_log.close)
+
+        node._cold_storage_set(atoms[0])
+        self.assertEqual(node.cold_storage_size, record)
+        # the second record would end one byte past the limit
+        node._cold_storage_set(atoms[1])
+        self.assertEqual(len(node.cold_storage_log), 1)
+        self.assertEqual(node.cold_storage_size, record)
+
+    def test_torn_tail_record_is_dropped(self) -> None:
+        atom = Atom(data=b"kept", kind=AtomKind.BYTES)
+        node = self._node()
+        node._cold_storage_set(atom)
+        size = node.cold_storage_size
+        with open(Path(self.path) / LOG_FILENAME, "ab") as f:
+            f.write(b"\x01" * 40)
+
+        reopened = self._node()
+        self.assertEqual(reopened.cold_storage_size, size)
+        self.assertEqual(reopened._cold_storage_get(atom.object_id()).data, b"kept")
+
+    def test_reads_legacy_atom_files(self) -> None:
+        atom = Atom(data=b"legacy", kind=AtomKind.BYTES)
+        legacy = Path(self.path) / f"{atom.object_id().hex().upper()}.bin"
+        legacy.write_bytes(atom.to_bytes())
+
+        node = self._node()
+        self.assertEqual(node._cold_storage_get(atom.object_id()).data, b"legacy")
+
+
+if __name__ == "__main__":
+    unittest.main()
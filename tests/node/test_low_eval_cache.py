@@ -0,0 +1,88 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.machine import Expr, Meter  # noqa: E402
+from astreum.machine.evaluations import low_evaluation  # noqa: E402
+from astreum.node import Node  # noqa: E402
+
+# two nands: 0xF0 nand 0x0F = 0xFF, then 0xFF nand 0xFF = 0x00; cost 2 + 2
+PROGRAM = [b"\xf0", b"\x0f", b"nand", b"\xff", b"nand"]
+PROGRAM_COST = 4
+
+
+def _is_meter_error(expr) -> bool:
+    return (
+        isinstance(expr, Expr.ListExpr)
+        and expr.elements[0].value == "error"
+        and expr.elements[2].value == b"meter limit"
+    )
+
+
+class TestLowEvalCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.node = Node()
+        self.runs = mock.patch.object(
+            low_evaluation, "_low_eval", wraps=low_evaluation._low_eval
+        )
+        self.run = self.runs.start()
+        self.addCleanup(self.runs.stop)
+
+    def test_repeat_program_is_served_from_cache(self) -> None:
+        first_meter = Meter()
+        first = self.node.low_eval(list(PROGRAM), first_meter)
+        second_meter = Meter(limit=100)
+        second_meter.used = 10
+        second = self.node.low_eval(list(PROGRAM), second_meter)
+
+        self.assertEqual(self.run.call_count, 1)
+        self.assertEqual(first.value, b"\x00")
+        self.assertEqual(second.value, b"\x00")
+        self.assertEqual(first_meter.used, PROGRAM_COST)
+        self.assertEqual(second_meter.used, 10 + PROGRAM_COST)
+
+    def test_hit_that_exceeds_meter_fails_like_an_uncached_run(self) -> None:
+        self.node.low_eval(list(PROGRAM), Meter())
+
+        # the first charge alone reaches the limit, so nothing is recorded
+        meter = Meter(limit=2)
+        result = self.node.low_eval(list(PROGRAM), meter)
+        self.assertTrue(_is_meter_error(result))
+        self.assertEqual(meter.used, 0)
+
+        # a limit that only the second charge crosses leaves the first charge
+        # in place, exactly as on a node without the cache
+        cached_meter = Meter(limit=3)
+        cached = self.node.low_eval(list(PROGRAM), cached_meter)
+        uncached_node = Node()
+        uncached_node.low_eval_cache = None
+        uncached_meter = Meter(limit=3)
+        uncached = uncached_node.low_eval(list(PROGRAM), uncached_meter)
+        self.assertTrue(_is_meter_error(cached))
+        self.assertTrue(_is_meter_error(uncached))
+        self.assertEqual(cached_meter.used, uncached_meter.used)
+
+    def test_disabled_meter_bypasses_cache_and_is_not_charged(self) -> None:
+        meter = Meter(enabled=False, limit=1)
+        for _ in range(2):
+            self.assertEqual(self.node.low_eval(list(PROGRAM), meter).value, b"\x00")
+        self.assertEqual(meter.used, 0)
+        self.assertEqual(self.run.call_count, 2)
+        self.assertEqual(self.node.low_eval_cache, {})
+
+    def test_meter_without_limit_is_charged_on_hits(self) -> None:
+        meter = Meter(limit=None)
+        for _ in range(3):
+            self.assertEqual(self.node.low_eval(list(PROGRAM), meter).value, b"\x00")
+        self.assertEqual(meter.used, 3 * PROGRAM_COST)
+        self.assertEqual(self.run.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.machine import Expr, Meter  # noqa: E402
+from astreum.node import Node  # noqa: E402
+
+# nand charges 2, heap_set charges len(value) = 1, heap_get charges 1;
+# 0xFF nand 0x07 leaves 0xF8
+PROGRAM = [b"\xf0", b"\x0f", b"nand", b"k", b"\x07", b"heap_set", b"k", b"heap_get", b"nand"]
+PROGRAM_COST = 6
+
+
+def _error_message(expr):
+    if isinstance(expr, Expr.ListExpr) and expr.elements[0].value == "error":
+        return expr.elements[2].value
+    return None
+
+
+class TestLowEvalMeter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.node = Node()
+        # exercise the interpreter itself on every call
+        self.node.low_eval_cache = None
+
+    def test_charges_follow_meter_limit_rule(self) -> None:
+        meter = Meter(limit=PROGRAM_COST + 1)
+        self.assertEqual(self.node.low_eval(list(PROGRAM), meter).value, b"\xf8")
+        self.assertEqual(meter.used, PROGRAM_COST)
+
+        # reaching the limit exactly fails, like Meter.charge_bytes; the charges
+        # before the failing one stay recorded
+        meter = Meter(limit=PROGRAM_COST)
+        result = self.node.low_eval(list(PROGRAM), meter)
+        self.assertEqual(_error_message(result), b"meter limit")
+        self.assertEqual(meter.used, 4)
+
+    def test_disabled_meter_is_never_charged(self) -> None:
+        meter = Meter(enabled=False, limit=1)
+        self.assertEqual(self.node.low_eval(list(PROGRAM), meter).value, b"\xf8")
+        self.assertEqual(meter.used, 0)
+
+    def test_meter_without_limit_counts_every_charge(self) -> None:
+        meter = Meter(limit=None)
+        meter.used = 5
+        self.assertEqual(self.node.low_eval(list(PROGRAM), meter).value, b"\xf8")
+        self.assertEqual(meter.used, 5 + PROGRAM_COST)
+
+    def test_charges_survive_a_raising_storage_opcode(self) -> None:
+        def failing_get(key):
+            raise RuntimeError("storage offline")
+
+        self.node.storage_get = failing_get
+        code = [b"\xf0", b"\x0f", b"nand", b"\x00", b"\x00", b"\x01", b"atom_slice"]
+        meter = Meter()
+        with self.assertRaises(RuntimeError):
+            self.node.low_eval(code, meter)
+        self.assertEqual(meter.used, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
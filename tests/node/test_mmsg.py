@@ -0,0 +1,115 @@
+import select
+import socket
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.communication import mmsg  # noqa: E402
+from astreum.communication.mmsg import BatchReceiver, BatchSender  # noqa: E402
+
+
+def _udp_pair(family: int, host: str):
+    receiver = socket.socket(family, socket.SOCK_DGRAM)
+    sender = socket.socket(family, socket.SOCK_DGRAM)
+    try:
+        receiver.bind((host, 0))
+        sender.bind((host, 0))
+    except OSError:
+        receiver.close()
+        sender.close()
+        raise
+    return receiver, sender
+
+
+class TestBatchUdp(unittest.TestCase):
+    def _pair(self, family: int = socket.AF_INET, host: str = "127.0.0.1"):
+        receiver, sender = _udp_pair(family, host)
+        self.addCleanup(receiver.close)
+        self.addCleanup(sender.close)
+        return receiver, sender
+
+    def _receive(self, receiver: BatchReceiver, count: int):
+        received = []
+        while len(received) < count:
+            # never block in recv when nothing arrived; fail instead of hanging
+            ready, _, _ = select.select([receiver.sock], [], [], 2.0)
+            if not ready:
+                self.fail(f"received {len(received)} of {count} datagrams")
+            received.extend(receiver.recv())
+        return received
+
+    def _round_trip(self, family: int, host: str) -> None:
+        receiver_sock, sender_sock = self._pair(family, host)
+        receiver = BatchReceiver(receiver_sock, max_messages=4, bufsize=64)
+        sender = BatchSender(sender_sock, max_messages=4)
+        if mmsg._recvmmsg is not None:
+            self.assertIsNotNone(receiver._msgvec)
+        if mmsg._sendmmsg is not None:
+            self.assertIsNotNone(sender._msgvec)
+
+        target = receiver_sock.getsockname()
+        payloads = [bytes([idx]) * (idx + 1) for idx in range(10)]
+        failures = sender.send([(payload, target) for payload in payloads])
+        self.assertEqual(failures, [])
+
+        received = self._receive(receiver, len(payloads))
+        self.assertEqual([data for data, _ in received], payloads)
+        sender_addr = sender_sock.getsockname()
+        for _, addr in received:
+            self.assertEqual(addr[:2], sender_addr[:2])
+
+    def test_ipv4_batch_round_trip(self) -> None:
+        self._round_trip(socket.AF_INET, "127.0.0.1")
+
+    def test_ipv6_batch_round_trip(self) -> None:
+        if not socket.has_ipv6:
+            self.skipTest("IPv6 unavailable")
+        try:
+            probe, other = _udp_pair(socket.AF_INET6, "::1")
+        except OSError:
+            self.skipTest("IPv6 loopback unavailable")
+        probe.close()
+        other.close()
+        self._round_trip(socket.AF_INET6, "::1")
+
+    def test_hostname_destination_falls_back_to_sendto_in_order(self) -> None:
+        receiver_sock, sender_sock = self._pair()
+        receiver = BatchReceiver(receiver_sock)
+        sender = BatchSender(sender_sock)
+        port = receiver_sock.getsockname()[1]
+
+        packets = [
+            (b"first", ("127.0.0.1", port)),
+            (b"second", ("localhost", port)),
+            (b"third", ("127.0.0.1", port)),
+        ]
+        self.assertIsNone(mmsg._encode_address(socket.AF_INET, packets[1][1]))
+        self.assertEqual(sender.send(packets), [])
+
+        received = self._receive(receiver, len(packets))
+        self.assertEqual([data for data, _ in received], [b"first", b"second", b"third"])
+
+    def test_timeout_sockets_use_recvfrom_and_sendto(self) -> None:
+        receiver_sock, sender_sock = self._pair()
+        receiver_sock.settimeout(2.0)
+        sender_sock.settimeout(2.0)
+        receiver = BatchReceiver(receiver_sock)
+        sender = BatchSender(sender_sock)
+        self.assertIsNone(receiver._msgvec)
+        self.assertIsNone(sender._msgvec)
+
+        target = receiver_sock.getsockname()
+        self.assertEqual(sender.send([(b"one", target), (b"two", target)]), [])
+
+        received = receiver.recv() + receiver.recv()
+        self.assertEqual([data for data, _ in received], [b"one", b"two"])
+        self.assertEqual(received[0][1], sender_sock.getsockname())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import sys
-import time
+import threading
 import unittest
 from pathlib import Path
 
@@ -10,6 +10,7 @@ SRC_DIR = ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
+from astreum.consensus.models.block import Block  # noqa: E402
 from astreum.node import Node  # noqa: E402
 
 
@@ -20,6 +21,7 @@ class TestNodeValidation(unittest.TestCase):
 
         secret_key = Ed25519PrivateKey.generate()
         node.validate(secret_key)
+        self.addCleanup(node._validation_stop_event.set)
 
         self.assertIsNotNone(node.latest_block_hash)
         self.assertIsNotNone(node.latest_block)
@@ -27,16 +29,41 @@ class TestNodeValidation(unittest.TestCase):
         print(f"latest_block_hash: {node.latest_block_hash.hex()}")
 
         initial_hash = node.latest_block_hash
-        timeout = time.time() + 10
-        while time.time() < timeout:
-            current_hash = node.latest_block_hash
-            if current_hash != initial_hash and current_hash is not None:
-                print(f"new latest_block_hash: {current_hash.hex()}")
-                break
-            time.sleep(0.1)
+        current_hash = node.wait_for_new_block(initial_hash, timeout=10)
+        if current_hash is not None:
+            print(f"new latest_block_hash: {current_hash.hex()}")
         else:
             print("latest_block_hash did not change before timeout")
 
+    def test_announced_blocks_load_immediately(self) -> None:
+        node = Node()
+        unloadable = []
+
+        class _LoadOnNotify(threading.Condition):
+            def notify_all(self) -> None:
+                # a waiter may load the block the moment it wakes, so the
+                # atoms must already be stored when the hash is announced
+                try:
+                    Block.from_atom(node, node.latest_block_hash)
+                except Exception as exc:
+                    unloadable.append(exc)
+                super().notify_all()
+
+        node.latest_block_condition = _LoadOnNotify()
+        node.connect()
+        node.validate(Ed25519PrivateKey.generate())
+        self.addCleanup(node._validation_stop_event.set)
+
+        previous_hash = node.latest_block_hash
+        for number in range(1, 3):
+            current_hash = node.wait_for_new_block(previous_hash, timeout=30)
+            self.assertIsNotNone(current_hash)
+            self.assertEqual(unloadable, [])
+            block = Block.from_atom(node, current_hash)
+            self.assertEqual(block.previous_block_hash, previous_hash)
+            self.assertGreaterEqual(block.number, number)
+            previous_hash = current_hash
+
 
 if __name__ == "__main__":
     unittest.main()
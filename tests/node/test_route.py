@@ -0,0 +1,122 @@
+import random
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.communication.models.peer import Peer  # noqa: E402
+from astreum.communication.models.route import Route  # noqa: E402
+
+RELAY_KEY = bytes(32)
+
+
+def _key(prefix: int, low: int) -> bytes:
+    """A key in bucket 0 of RELAY_KEY: top bit set, ``prefix`` below it, ``low`` at the end."""
+    return ((1 << 255) | (prefix << 240) | low).to_bytes(32, "big")
+
+
+def _peer() -> Peer:
+    return Peer(X25519PrivateKey.generate(), X25519PrivateKey.generate().public_key())
+
+
+class TestRouteBuckets(unittest.TestCase):
+    def test_full_bucket_trades_redundant_key_for_diverse_one(self) -> None:
+        route = Route(RELAY_KEY, bucket_size=4)
+        crowded = [_key(0, low) for low in range(1, 5)]
+        for key in crowded:
+            route.add_peer(key)
+
+        newcomer = _key(0x7FFF, 0)
+        route.add_peer(newcomer, _peer())
+
+        bucket = route.buckets[0]
+        self.assertEqual(len(bucket), 4)
+        self.assertIn(newcomer, bucket)
+        self.assertEqual(set(route._key_ints), set(bucket))
+
+    def test_key_without_peer_never_evicts_a_member(self) -> None:
+        route = Route(RELAY_KEY, bucket_size=4)
+        crowded = [_key(0, low) for low in range(1, 5)]
+        peers = {key: _peer() for key in crowded}
+        for key in crowded:
+            route.add_peer(key, peers[key])
+        version = route.version
+
+        # validator pings register bare keys; they must not displace sessions
+        route.add_peer(_key(0x7FFF, 0))
+        self.assertEqual(route.buckets[0], crowded)
+        self.assertEqual(route.peers, peers)
+        self.assertEqual(route.version, version)
+        self.assertIs(route.closest_peer_for_hash(crowded[0]), peers[crowded[0]])
+
+    def test_full_bucket_keeps_members_without_diversity_policy(self) -> None:
+        route = Route(RELAY_KEY, bucket_size=4, diverse=False)
+        crowded = [_key(0, low) for low in range(1, 5)]
+        for key in crowded:
+            route.add_peer(key)
+
+        route.add_peer(_key(0x7FFF, 0))
+        self.assertEqual(route.buckets[0], crowded)
+
+    def test_no_churn_for_equally_redundant_newcomer(self) -> None:
+        route = Route(RELAY_KEY, bucket_size=4)
+        spread = [_key(prefix, 0) for prefix in (0x0000, 0x2000, 0x4000, 0x6000)]
+        for key in spread:
+            route.add_peer(key)
+        version = route.version
+
+        route.add_peer(_key(0x0000, 1))
+        self.assertEqual(route.buckets[0], spread)
+        self.assertEqual(route.version, version)
+
+
+class TestRouteLookups(unittest.TestCase):
+    def test_closest_per_bucket_skips_key_mid_removal(self) -> None:
+        route = Route(RELAY_KEY, bucket_size=4)
+        keys = [_key(0, low) for low in (1, 2, 4)]
+        for key in keys:
+            route.add_peer(key)
+
+        # remove_peer drops the key from _key_ints before its bucket list
+        del route._key_ints[keys[0]]
+        self.assertEqual(route.closest_per_bucket(keys[0]), [keys[1]])
+
+    def test_closest_per_bucket_survives_concurrent_removal(self) -> None:
+        rng = random.Random(7)
+        route = Route(RELAY_KEY, bucket_size=4)
+        keys = [rng.randbytes(32) for _ in range(64)]
+        for key in keys:
+            route.add_peer(key)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        done = threading.Event()
+
+        def churn() -> None:
+            while not done.is_set():
+                for key in keys:
+                    route.remove_peer(key)
+                    route.add_peer(key)
+
+        worker = threading.Thread(target=churn, daemon=True)
+        worker.start()
+        try:
+            for _ in range(2000):
+                for key in route.closest_per_bucket(rng.randbytes(32)):
+                    self.assertEqual(len(key), 32)
+        finally:
+            done.set()
+            worker.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
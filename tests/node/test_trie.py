@@ -0,0 +1,55 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from astreum.node import Node  # noqa: E402
+from astreum.storage.models.trie import Trie  # noqa: E402
+
+
+class TestTriePutGet(unittest.TestCase):
+    def setUp(self) -> None:
+        self.node = Node()
+
+    def test_random_keys_round_trip(self) -> None:
+        rng = random.Random(50)
+        trie = Trie()
+        expected = {}
+        for idx in range(50):
+            key = rng.randbytes(32)
+            value = idx.to_bytes(2, "big")
+            trie.put(self.node, key, value)
+            expected[key] = value
+
+        for key, value in expected.items():
+            self.assertEqual(trie.get(self.node, key), value)
+
+    def test_splits_below_root_keep_earlier_keys(self) -> None:
+        # every key shares the first byte, so later inserts split nodes that
+        # already sit under the root rather than the root itself
+        keys = [bytes([0xAA, low]) for low in (0x00, 0x80, 0x40, 0xC0, 0x20, 0x01)]
+        trie = Trie()
+        for idx, key in enumerate(keys):
+            trie.put(self.node, key, bytes([idx]))
+            for seen_idx, seen in enumerate(keys[: idx + 1]):
+                self.assertEqual(trie.get(self.node, seen), bytes([seen_idx]))
+
+    def test_update_after_split_changes_only_that_key(self) -> None:
+        rng = random.Random(7)
+        keys = [rng.randbytes(32) for _ in range(20)]
+        trie = Trie()
+        for key in keys:
+            trie.put(self.node, key, b"old")
+        trie.put(self.node, keys[3], b"new")
+
+        for idx, key in enumerate(keys):
+            self.assertEqual(trie.get(self.node, key), b"new" if idx == 3 else b"old")
+
+
+if __name__ == "__main__":
+    unittest.main()